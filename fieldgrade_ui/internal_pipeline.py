@@ -193,7 +193,8 @@ def run_termite_to_ecology_pipeline_library(
     pol = load_policy(pol_path)
     allow = yaml.safe_load(allow_path.read_text(encoding="utf-8")) or {}
     allow["_base_dir"] = str(allow_path.resolve().parent)
-    allow_for_hash = {k: v for k, v in allow.items() if k != "_base_dir"}
+    allow_for_hash = dict(allow)
+    allow_for_hash.pop("_base_dir", None)
 
     inp = SealInputs(
         toolchain_id=t_cfg.toolchain_id,
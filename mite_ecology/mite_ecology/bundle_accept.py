@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import sqlite3
 import zipfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -117,14 +117,14 @@ def _validate_optional_contracts(z: zipfile.ZipFile) -> Dict[str, object]:
     if s_txt:
         try:
             obj = json.loads(s_txt)
-            issues = [i.__dict__ for i in _validate_studspec(obj)]
+            issues = [asdict(i) for i in _validate_studspec(obj)]
             out["studspec"] = {"ok": len(issues) == 0, "issues": issues}
         except Exception as e:
             out["studspec"] = {"ok": False, "issues": [{"path": "/", "message": f"parse_error:{e}", "severity": "error"}]}
     if t_txt:
         try:
             obj = json.loads(t_txt)
-            issues = [i.__dict__ for i in _validate_tubespec(obj)]
+            issues = [asdict(i) for i in _validate_tubespec(obj)]
             out["tubespec"] = {"ok": len(issues) == 0, "issues": issues}
         except Exception as e:
             out["tubespec"] = {"ok": False, "issues": [{"path": "/", "message": f"parse_error:{e}", "severity": "error"}]}
@@ -236,7 +236,8 @@ def accept_termite_bundle(
 
     policy_id = pol.policy_id
     policy_hash = pol.canonical_hash()
-    allow_for_hash = {k: v for k, v in allow.items() if k != "_base_dir"}
+    allow_for_hash = dict(allow)
+    allow_for_hash.pop("_base_dir", None)
     allowlist_hash = sha256_bytes(canonical_json(allow_for_hash).encode("utf-8"))
 
     mode = (override_mode or pol.mode or "REVIEW_ONLY").upper().strip()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import asdict
 from pathlib import Path
 import zipfile
 
@@ -409,9 +410,9 @@ def cmd_components_manifest(args) -> int:
 def cmd_spec_validate(args) -> int:
     obj = json.loads(Path(args.file).read_text(encoding="utf-8"))
     if args.kind.lower() in ("stud","studspec"):
-        issues = [i.__dict__ for i in validate_studspec(obj)]
+        issues = [asdict(i) for i in validate_studspec(obj)]
     elif args.kind.lower() in ("tube","tubespec"):
-        issues = [i.__dict__ for i in validate_tubespec(obj)]
+        issues = [asdict(i) for i in validate_tubespec(obj)]
     else:
         raise SystemExit("unknown kind")
     out = {"ok": len([i for i in issues if i.get("severity","error")=="error"]) == 0, "issues": issues}
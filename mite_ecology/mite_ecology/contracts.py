@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,6 +24,12 @@ class LDNARef:
 def parse_ldna(uri: str) -> Optional[LDNARef]:
     if not isinstance(uri, str) or not uri.startswith("ldna://"):
         return None
+    return _parse_ldna_cached(uri)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ldna_cached(uri: str) -> Optional[LDNARef]:
+    # URIs repeat heavily across specs; LDNARef is frozen, so sharing results is safe.
     m = _LDNA_RE.match(uri)
     if not m:
         return None
@@ -36,12 +43,28 @@ def parse_ldna(uri: str) -> Optional[LDNARef]:
     )
 
 
+def _schema_uris(reg: Dict[str, Any]) -> frozenset:
+    return frozenset(
+        s["uri"]
+        for s in (reg.get("schemas") or [])
+        if isinstance(s, dict) and isinstance(s.get("uri"), str)
+    )
+
+
 def load_ldna_registry(path: str | Path) -> Dict[str, Any]:
+    """Load an LDNA registry YAML; adds a private "_uri_index" (frozenset of schema URIs)."""
     p = Path(path).resolve()
-    return yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    reg = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    if isinstance(reg, dict):
+        reg["_uri_index"] = _schema_uris(reg)
+    return reg
 
 
 def registry_has(reg: Dict[str, Any], uri: str) -> bool:
+    idx = reg.get("_uri_index")
+    if idx is not None:
+        return uri in idx
+    # registries built in memory (no load_ldna_registry) fall back to a scan
     schemas = reg.get("schemas") or []
     return any(isinstance(s, dict) and s.get("uri") == uri for s in schemas)
 
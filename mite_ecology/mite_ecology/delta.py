@@ -1,38 +1,48 @@
 from __future__ import annotations
-import json
+import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
+from .hashutil import json_loads
 from .kg import KnowledgeGraph
 
 SUPPORTED_OPS = {"ADD_NODE","ADD_EDGE","REMOVE_NODE","REMOVE_EDGE"}
 
 def apply_delta_lines(kg: KnowledgeGraph, lines: Iterable[str]) -> int:
     n = 0
+    # KG methods bound once; unsupported ops fall through every branch and are skipped.
+    upsert_node, upsert_edge = kg.upsert_node, kg.upsert_edge
+    remove_node, remove_edge_by_key = kg.remove_node, kg.remove_edge_by_key
     for line in lines:
         s = line.strip()
         if not s:
             continue
-        obj = json.loads(s)
+        obj = json_loads(s)
         op = obj.get("op")
-        if op not in SUPPORTED_OPS:
-            continue
         if op == "ADD_NODE":
-            kg.upsert_node(str(obj["id"]), str(obj.get("type","Thing")), dict(obj.get("attrs") or {}))
+            upsert_node(str(obj["id"]), str(obj.get("type","Thing")), dict(obj.get("attrs") or {}))
             n += 1
         elif op == "ADD_EDGE":
-            kg.upsert_edge(str(obj["src"]), str(obj["dst"]), str(obj.get("type","RELATED")), dict(obj.get("attrs") or {}))
+            upsert_edge(str(obj["src"]), str(obj["dst"]), str(obj.get("type","RELATED")), dict(obj.get("attrs") or {}))
             n += 1
         elif op == "REMOVE_NODE":
-            kg.remove_node(str(obj["id"]))
+            remove_node(str(obj["id"]))
             n += 1
         elif op == "REMOVE_EDGE":
             # expect edge_key if provided else recompute from src/dst/type/attrs
             ek = obj.get("edge_key")
             if ek:
-                kg.remove_edge_by_key(str(ek))
+                remove_edge_by_key(str(ek))
                 n += 1
     return n
 
+def apply_delta_text(kg: KnowledgeGraph, text: str) -> int:
+    """apply_delta_lines over a JSONL payload, yielding one line at a time (no split list).
+
+    Splits on newlines only, so U+2028 etc. inside JSON strings stay intact.
+    """
+    return apply_delta_lines(kg, io.StringIO(text))
+
 def apply_delta_file(kg: KnowledgeGraph, path: Path) -> int:
-    return apply_delta_lines(kg, path.read_text(encoding="utf-8").splitlines())
+    with path.open("r", encoding="utf-8") as f:
+        return apply_delta_lines(kg, f)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
-from .hashutil import canonical_json, sha256_hex, sha256_str
+from .hashutil import canonical_json, json_loads, sha256_hex, sha256_str
 
 
 def urn_mite(kind: str, value: Any) -> str:
@@ -42,7 +41,7 @@ def _canonical_jsonl(lines: Iterable[str]) -> str:
         if not s:
             continue
         # Ensure each line is canonical JSON.
-        out.append(canonical_json(json.loads(s)))
+        out.append(canonical_json(json_loads(s)))
     return "\n".join(out) + ("\n" if out else "")
 
 
@@ -63,7 +62,7 @@ def latest_event_hash(path: Path) -> Optional[str]:
     ln = _read_last_nonempty_line(path)
     if not ln:
         return None
-    obj = json.loads(ln)
+    obj = json_loads(ln)
     h = obj.get("event_hash")
     return str(h) if h else None
 
@@ -137,10 +136,12 @@ def iter_ledger(ledger_path: Path) -> Iterator[Dict[str, Any]]:
     p = Path(ledger_path)
     if not p.exists():
         return
-    for ln in p.read_text(encoding="utf-8").splitlines():
-        if not ln.strip():
-            continue
-        yield json.loads(ln)
+    # Stream the file; records are canonical JSON, so a raw newline only ever ends one.
+    with p.open("r", encoding="utf-8", newline="\n") as f:
+        for ln in f:
+            if not ln.strip():
+                continue
+            yield json_loads(ln)
 
 
 def verify_ledger_chain(ledger_path: Path) -> Tuple[bool, int]:
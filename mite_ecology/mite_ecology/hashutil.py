@@ -1,16 +1,107 @@
 from __future__ import annotations
-import hashlib, json
-from typing import Any
+import hashlib, json, mmap, os, re
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:  # optional fast JSON parser
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson = None
 
 def canonical_json(obj: Any) -> str:
+    # Stays on stdlib json on purpose: canonical bytes feed persisted content hashes, and
+    # orjson formats floats (1e16 vs 1e+16), NaN and non-str keys differently.
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
+# Same output as canonical_json() for a str, via the C escaper json.dumps ends up in.
+json_str = json.encoder.encode_basestring
+
+# orjson silently turns integers outside the 64-bit range into floats; any run of 19+
+# digits (which covers every such integer) sends the document to stdlib instead.
+_LONG_DIGITS_RE = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_RE_B = re.compile(rb"[0-9]{19}")
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when installed.
+
+    Inputs orjson would parse differently (>64-bit ints) or rejects while stdlib accepts
+    (NaN tokens, lone surrogate escapes) go to `json.loads`, so results match stdlib parsing.
+    """
+    if _orjson is not None:
+        pat = _LONG_DIGITS_RE if isinstance(data, str) else _LONG_DIGITS_RE_B
+        if pat.search(data) is None:
+            try:
+                return _orjson.loads(data)
+            except _orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Sorted-key, 2-space-indented JSON as UTF-8 bytes (for human-readable state files).
+
+    Not canonical: orjson (when installed) leaves non-ASCII unescaped, stdlib escapes it.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS | _orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+# All SHA-256 work in mite_ecology goes through these helpers. hashlib is backed by
+# OpenSSL, whose SHA-256 dispatches at runtime to SHA-NI / ARMv8 SHA2 instructions
+# when the CPU has them, so no separate accelerated backend is needed.
 def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 def sha256_str(s: str) -> str:
     return sha256_hex(s.encode("utf-8"))
 
+def sha256_fileobj(f: BinaryIO, bufsize: int = 1 << 20) -> str:
+    """SHA-256 of an open binary file from its current position to EOF, via one reusable buffer."""
+    h = hashlib.sha256()
+    buf = bytearray(bufsize)
+    mv = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        h.update(mv[:n])
+    return h.hexdigest()
+
+def sha256_file(path: str | Path, bufsize: int = 1 << 20) -> str:
+    """SHA-256 of a file without copying it into a Python bytes object.
+
+    Regular non-empty files are memory-mapped and handed to hashlib in one update (which
+    releases the GIL while digesting); anything mmap cannot map (empty files, pipes) is
+    streamed through one reusable buffer instead.
+    """
+    with open(path, "rb", buffering=0) as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mm = None
+        if mm is not None:
+            with mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return sha256_fileobj(f, bufsize)
+
 def stable_edge_key(src: str, dst: str, etype: str, attrs: Any) -> str:
     payload = {"src":src,"dst":dst,"type":etype,"attrs":attrs}
     return sha256_str(canonical_json(payload))
+
+def edge_key_and_attrs_json(src: str, dst: str, etype: str, attrs: Any) -> tuple[str, str]:
+    """(stable_edge_key(...), canonical_json(attrs)) with attrs encoded only once.
+
+    The key payload's sorted keys are attrs < dst < src < type, so for str endpoints it
+    is spliced around the attrs JSON; anything else goes through stable_edge_key.
+    """
+    attrs_json = canonical_json(attrs)
+    if type(src) is str and type(dst) is str and type(etype) is str:
+        payload = f'{{"attrs":{attrs_json},"dst":{json_str(dst)},"src":{json_str(src)},"type":{json_str(etype)}}}'
+        return sha256_str(payload), attrs_json
+    return stable_edge_key(src, dst, etype, attrs), attrs_json
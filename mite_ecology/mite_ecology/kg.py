@@ -1,8 +1,9 @@
 from __future__ import annotations
 import json
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple, Optional
-from .hashutil import canonical_json, stable_edge_key
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
+from .hashutil import canonical_json, edge_key_and_attrs_json
 from .timeutil import utc_now_iso
 
 @dataclass
@@ -23,6 +24,28 @@ class Edge:
 class KnowledgeGraph:
     def __init__(self, con):
         self.con = con
+        self._batch_depth = 0
+
+    def _commit(self) -> None:
+        # Inside batch() the enclosing block owns the transaction.
+        if self._batch_depth == 0:
+            self.con.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator["KnowledgeGraph"]:
+        """Group many mutations into one transaction (commit on success, rollback on error)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.con.rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.con.commit()
 
     def upsert_node(self, node_id: str, node_type: str, attrs: Dict[str, Any]) -> None:
         self.con.execute(
@@ -30,26 +53,26 @@ class KnowledgeGraph:
             "ON CONFLICT(id) DO UPDATE SET type=excluded.type, attrs_json=excluded.attrs_json",
             (node_id, node_type, canonical_json(attrs)),
         )
-        self.con.commit()
+        self._commit()
 
     def upsert_edge(self, src: str, dst: str, etype: str, attrs: Dict[str, Any]) -> int:
-        ek = stable_edge_key(src, dst, etype, attrs)
+        ek, attrs_json = edge_key_and_attrs_json(src, dst, etype, attrs)
         self.con.execute(
             "INSERT OR IGNORE INTO edges(edge_key,src,dst,type,attrs_json) VALUES(?,?,?,?,?)",
-            (ek, src, dst, etype, canonical_json(attrs)),
+            (ek, src, dst, etype, attrs_json),
         )
         row = self.con.execute("SELECT id FROM edges WHERE edge_key=?", (ek,)).fetchone()
-        self.con.commit()
+        self._commit()
         return int(row["id"])
 
     def remove_node(self, node_id: str) -> None:
         self.con.execute("DELETE FROM edges WHERE src=? OR dst=?", (node_id, node_id))
         self.con.execute("DELETE FROM nodes WHERE id=?", (node_id,))
-        self.con.commit()
+        self._commit()
 
     def remove_edge_by_key(self, edge_key: str) -> None:
         self.con.execute("DELETE FROM edges WHERE edge_key=?", (edge_key,))
-        self.con.commit()
+        self._commit()
 
     def nodes(self) -> List[Node]:
         rows = self.con.execute("SELECT id,type,attrs_json FROM nodes").fetchall()
@@ -108,7 +131,7 @@ class KnowledgeGraph:
             "ON CONFLICT(node_id) DO UPDATE SET dim=excluded.dim, vec_json=excluded.vec_json, updated_utc=excluded.updated_utc",
             (node_id, len(vec), json.dumps(vec, separators=(",", ":"), ensure_ascii=False), utc_now_iso()),
         )
-        self.con.commit()
+        self._commit()
 
     def get_node_embedding(self, node_id: str) -> List[float] | None:
         row = self.con.execute("SELECT vec_json FROM node_embeddings WHERE node_id=?", (node_id,)).fetchone()
@@ -122,7 +145,7 @@ class KnowledgeGraph:
             "ON CONFLICT(edge_id) DO UPDATE SET score=excluded.score, context_node_id=excluded.context_node_id, updated_utc=excluded.updated_utc",
             (edge_id, float(score), context_node_id, utc_now_iso()),
         )
-        self.con.commit()
+        self._commit()
 
     def list_attention(self, context_node_id: str, limit: int = 50) -> List[Tuple[int,float]]:
         rows = self.con.execute(
@@ -169,4 +192,4 @@ class KnowledgeGraph:
             "INSERT OR REPLACE INTO motifs(motif_id, context_node_id, motif_json, score, created_utc) VALUES(?,?,?,?,?)",
             (motif_id, context_node_id, canonical_json(motif_obj), float(score), created),
         )
-        self.con.commit()
+        self._commit()
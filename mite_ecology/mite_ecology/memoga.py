@@ -2,30 +2,59 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional
+import heapq
 import math
 
+import numpy as np
+
 from .hashutil import canonical_json, sha256_str
 from .timeutil import utc_now_iso
 from .kg import KnowledgeGraph
 
+# IN-lists are bound as one JSON array so each statement text is fixed regardless of
+# genome size, letting sqlite3's statement cache reuse the compiled plan.
+_SQL_EDGE_SCORES = (
+    "SELECT e.id, a.score FROM edges e LEFT JOIN edge_attention a ON a.edge_id=e.id "
+    "WHERE e.id IN (SELECT value FROM json_each(?)) ORDER BY e.id"
+)
+_SQL_NODE_TYPES = "SELECT type FROM nodes WHERE id IN (SELECT value FROM json_each(?))"
+_SQL_EDGE_ENDPOINTS = "SELECT src,dst FROM edges WHERE id IN (SELECT value FROM json_each(?))"
+
+
+def _json_ids(ids: List[Any]) -> str:
+    return json.dumps(ids, separators=(",", ":"))
+
+_U64_MASK = (1<<64)-1
+_INV_2_53 = 1.0 / float(1<<53)
+
 # Deterministic RNG (xorshift64*)
 class DRNG:
     def __init__(self, seed_hex: str):
         seed = int(seed_hex[:16], 16) if seed_hex else 88172645463393265
         if seed == 0:
             seed = 1
-        self.x = seed & ((1<<64)-1)
+        self.x = seed & _U64_MASK
 
     def next_u64(self) -> int:
+        # Right shifts of a 64-bit value cannot overflow, so only the left shift needs masking.
         x = self.x
-        x ^= (x >> 12) & ((1<<64)-1)
-        x ^= (x << 25) & ((1<<64)-1)
-        x ^= (x >> 27) & ((1<<64)-1)
+        x ^= x >> 12
+        x ^= (x << 25) & _U64_MASK
+        x ^= x >> 27
         self.x = x
-        return (x * 2685821657736338717) & ((1<<64)-1)
+        return (x * 2685821657736338717) & _U64_MASK
 
     def rand(self) -> float:
-        return (self.next_u64() >> 11) / float(1<<53)
+        # Multiplying by 2**-53 is exact, so this equals dividing by 2**53.
+        return (self.next_u64() >> 11) * _INV_2_53
+
+    def rand_batch(self, n: int) -> np.ndarray:
+        """Draw `n` floats in one call; element i equals the i-th successive `rand()`."""
+        nxt = self.next_u64
+        out = np.fromiter((nxt() >> 11 for _ in range(int(n))), dtype=np.float64, count=int(n))
+        # 53-bit ints convert exactly and scaling by 2**-53 is exact, so this matches rand().
+        out *= _INV_2_53
+        return out
 
     def randint(self, a: int, b: int) -> int:
         if b < a:
@@ -103,14 +132,9 @@ def fitness_of_genome(kg: KnowledgeGraph, g: Genome) -> Tuple[float, Dict[str, A
     # Evaluate using attention weights + compactness penalty + node type coverage proxy
     score = 0.0
     if g.edges:
-        qmarks=",".join(["?"]*len(g.edges))
-        rows = kg.con.execute(
-            f"SELECT e.id, a.score FROM edges e LEFT JOIN edge_attention a ON a.edge_id=e.id WHERE e.id IN ({qmarks})",
-            tuple(g.edges),
-        ).fetchall()
-        for r in rows:
-            if r["score"] is not None:
-                score += float(r["score"])
+        for _eid, a_score in kg.con.execute(_SQL_EDGE_SCORES, (_json_ids(g.edges),)):
+            if a_score is not None:
+                score += float(a_score)
             else:
                 score += 0.01
 
@@ -120,9 +144,7 @@ def fitness_of_genome(kg: KnowledgeGraph, g: Genome) -> Tuple[float, Dict[str, A
     # bonus: includes Document/Chunk/Blob types suggest "evidence"
     bonus = 0.0
     if g.nodes:
-        qmarks=",".join(["?"]*len(g.nodes))
-        rows = kg.con.execute(f"SELECT type FROM nodes WHERE id IN ({qmarks})", tuple(g.nodes)).fetchall()
-        types = {str(r["type"]) for r in rows}
+        types = {str(r[0]) for r in kg.con.execute(_SQL_NODE_TYPES, (_json_ids(g.nodes),))}
         if "Task" in types: bonus += 0.2
         if "Document" in types: bonus += 0.1
         if "Chunk" in types: bonus += 0.05
@@ -156,11 +178,9 @@ def mutate(kg: KnowledgeGraph, g: Genome, drng: DRNG, *, max_nodes: int, max_edg
 
     # Adjust nodes to include endpoints of selected edges
     if edges:
-        qmarks=",".join(["?"]*len(edges))
-        rows = kg.con.execute(f"SELECT src,dst FROM edges WHERE id IN ({qmarks})", tuple(edges)).fetchall()
         nodes_set=set(nodes)
-        for r in rows:
-            nodes_set.add(str(r["src"])); nodes_set.add(str(r["dst"]))
+        for src, dst in kg.con.execute(_SQL_EDGE_ENDPOINTS, (_json_ids(edges),)):
+            nodes_set.add(str(src)); nodes_set.add(str(dst))
         nodes = sorted(nodes_set)[:max_nodes]
 
     params = dict(g.params)
@@ -176,14 +196,10 @@ def mutate(kg: KnowledgeGraph, g: Genome, drng: DRNG, *, max_nodes: int, max_edg
 
 def crossover(g1: Genome, g2: Genome, drng: DRNG, *, max_nodes: int, max_edges: int) -> Genome:
     ctx = g1.context_node_id
-    # combine a subset of edges
-    e = sorted(set(g1.edges[:]) | set(g2.edges[:]))
-    # sample
-    keep = []
-    for eid in e:
-        if drng.rand() < 0.5:
-            keep.append(eid)
-    keep = keep[:max_edges]
+    # combine a subset of edges (sorted unique union)
+    e = np.union1d(np.asarray(g1.edges, dtype=np.int64), np.asarray(g2.edges, dtype=np.int64))
+    # sample: one draw per candidate edge, in ascending edge order
+    keep = e[drng.rand_batch(len(e)) < 0.5][:max_edges].tolist()
     nodes = sorted(set(g1.nodes) | set(g2.nodes))[:max_nodes]
     params = {"dropout": (float(g1.params.get("dropout",0.1)) + float(g2.params.get("dropout",0.1))) / 2.0,
               "width": int((int(g1.params.get("width",128)) + int(g2.params.get("width",128))) / 2)}
@@ -251,9 +267,14 @@ def run_memoga(
 
     if motifs:
         # Sort deterministically: score desc, then canonical payload hash asc
+        # Only the head is needed, so take the min (first on ties, like a stable sort) and
+        # hash each motif's payload exactly once.
         norm = [_motif_to_json(m) for m in motifs]
-        norm.sort(key=lambda x: (-float(x.get("score", 0.0)), sha256_str(canonical_json({k: x[k] for k in ("context", "nodes", "edges") if k in x}))))
-        base_motif_json = norm[0]
+        keyed = [
+            ((-x["score"], sha256_str(canonical_json({"context": x["context"], "nodes": x["nodes"], "edges": x["edges"]}))), x)
+            for x in norm
+        ]
+        base_motif_json = min(keyed, key=lambda kx: kx[0])[1]
     else:
         motif_row = kg.con.execute(
             "SELECT motif_json, score FROM motifs WHERE context_node_id=? ORDER BY score DESC, motif_id ASC LIMIT 1",
@@ -290,31 +311,45 @@ def run_memoga(
     best = pop[0]
     best_fit, best_ev = fitness_of_genome(kg, best)
 
+    # Fitness is memoized in genome_eval, but elites carry over every generation; keep an
+    # in-process memo so only newly produced genomes cost a DB round-trip.
+    fit_memo: Dict[str, float] = {best.genome_id: float(best_fit)}
+
+    def _fit(g: Genome) -> float:
+        f = fit_memo.get(g.genome_id)
+        if f is None:
+            f, _ev = fitness_of_genome(kg, g)
+            fit_memo[g.genome_id] = f
+        return f
+
+    n_elite = max(1, elite)
+    n_pop = int(population)
+    p_cross = float(crossover_rate)
+    p_mut = float(mutation_rate)
+    rand = drng.rand
     for _gen in range(int(generations)):
-        scored: List[Tuple[float, Genome]] = []
-        for g in pop:
-            fit, _ev = fitness_of_genome(kg, g)
-            scored.append((fit, g))
-        scored.sort(key=lambda x: (x[0], x[1].genome_id), reverse=True)
+        scored: List[Tuple[float, Genome]] = [(_fit(g), g) for g in pop]
+        # nlargest == sorted(reverse=True)[:k] (including tie order) at O(n log k)
+        ranked = heapq.nlargest(n_elite, scored, key=lambda x: (x[0], x[1].genome_id))
 
-        elites = [g for _, g in scored[: max(1, elite)]]
+        elites = [g for _, g in ranked]
 
         # update best
-        if scored and scored[0][0] > best_fit:
-            best_fit = float(scored[0][0])
-            best = scored[0][1]
+        if ranked and ranked[0][0] > best_fit:
+            best_fit = float(ranked[0][0])
+            best = ranked[0][1]
             best_fit, best_ev = fitness_of_genome(kg, best)
 
         new_pop = elites[:]
-        while len(new_pop) < int(population):
-            if drng.rand() < float(crossover_rate) and len(elites) >= 2:
+        while len(new_pop) < n_pop:
+            if rand() < p_cross and len(elites) >= 2:
                 p1 = drng.choice(elites)
                 p2 = drng.choice(elites)
                 child = crossover(p1, p2, drng, max_nodes=max_nodes, max_edges=max_edges)
             else:
                 child = drng.choice(elites)
 
-            if drng.rand() < float(mutation_rate):
+            if rand() < p_mut:
                 child = mutate(kg, child, drng, max_nodes=max_nodes, max_edges=max_edges)
             new_pop.append(child)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +12,11 @@ from jsonschema import Draft202012Validator
 
 from .hashutil import canonical_json, sha256_str
 
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 @dataclass(frozen=True)
 class RegistryLoadResult:
@@ -32,20 +39,40 @@ def _registry_dir() -> Path:
     return _repo_root() / "mite_ecology" / "registry"
 
 
+# Parsed registry YAML keyed by resolved path; entries are invalidated when the
+# file's (mtime_ns, size) signature changes.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    obj = yaml.safe_load(path.read_text(encoding="utf-8"))
+    st = path.stat()
+    key = str(path.resolve())
+    sig = (int(st.st_mtime_ns), int(st.st_size))
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        # Callers may mutate the result; never hand out the cached object.
+        return copy.deepcopy(hit[1])
+
+    obj = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
     if obj is None:
-        return {}
+        obj = {}
     if not isinstance(obj, dict):
         raise ValueError(f"registry YAML must be a mapping: {path}")
-    return obj
+    _YAML_CACHE[key] = (sig, obj)
+    return copy.deepcopy(obj)
 
 
-def _load_schema_validator(schema_path: Path) -> Draft202012Validator:
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+@functools.lru_cache(maxsize=16)
+def _load_schema_validator_cached(schema_path: str) -> Draft202012Validator:
+    schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
     return Draft202012Validator(schema)
 
 
+def _load_schema_validator(schema_path: Path) -> Draft202012Validator:
+    # Validator construction compiles the meta-schema; reuse it across loads.
+    return _load_schema_validator_cached(str(schema_path))
+
+
 def _err_path_str(err_path: Iterable[Any]) -> str:
     # jsonschema gives a deque/list of path components
     parts: List[str] = []
@@ -69,16 +96,23 @@ def _validate_or_raise(data: Dict[str, Any], *, schema_path: Path, what: str) ->
 
 
 def _sorted_by_id(items: List[Any], *, id_key: str) -> List[Any]:
-    def key_fn(item: Any) -> Tuple[str, str]:
+    def id_of(item: Any) -> str:
         if isinstance(item, dict):
             raw = item.get(id_key)
-            k = str(raw) if raw is not None else ""
-        else:
-            k = ""
-        # tie-breaker prevents nondeterminism when ids are missing/duplicated
-        return (k, canonical_json(item))
-
-    return sorted(items, key=key_fn)
+            return str(raw) if raw is not None else ""
+        return ""
+
+    ids = [id_of(item) for item in items]
+    if len(set(ids)) == len(ids):
+        # Unique ids fully determine the order; the JSON tie-breaker would never be consulted.
+        order = sorted(range(len(items)), key=ids.__getitem__)
+        return [items[i] for i in order]
+
+    # tie-breaker prevents nondeterminism when ids are missing/duplicated;
+    # decorate once so each item is canonicalized exactly one time.
+    keyed: List[Tuple[Tuple[str, str], Any]] = [((k, canonical_json(item)), item) for k, item in zip(ids, items)]
+    keyed.sort(key=lambda kv: kv[0])
+    return [item for _, item in keyed]
 
 
 def _canonicalize_registry(data: Dict[str, Any]) -> Dict[str, Any]:
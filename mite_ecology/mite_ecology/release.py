@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-import json
 import time
 import zipfile
-import hashlib
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from .hashutil import canonical_json, sha256_hex, sha256_str
+from .hashutil import canonical_json, json_loads, sha256_file, sha256_fileobj, sha256_hex, sha256_str
 from .registry import RegistryLoadResult, load_components_registry, load_remotes_registry, load_variants_registry
 
 
@@ -27,13 +25,9 @@ DETERMINISTIC_CREATED_UTC = "1970-01-01T00:00:00Z"
 
 
 def _utc_iso(ts: Optional[float] = None) -> str:
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts or time.time()))
-
-
-def _sha256_bytes(data: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    return h.hexdigest()
+    # Same output as strftime("%Y-%m-%dT%H:%M:%SZ") without the locale-aware formatter.
+    t = time.gmtime(ts or time.time())
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
 
 
 def _build_release_cyclonedx_bom(*, release_id: str, manifest_sha256: str, registries: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
@@ -73,22 +67,37 @@ def _build_release_cyclonedx_bom(*, release_id: str, manifest_sha256: str, regis
     }
 
 
-def _deterministic_zip_write(zip_path: Path, files: Dict[str, bytes]) -> None:
-    """Write a deterministic zip (stable ordering + fixed timestamps)."""
+# Entries smaller than this are stored: deflate framing overhead outweighs any saving.
+ZIP_STORE_BELOW_BYTES = 256
+DEFAULT_ZIP_COMPRESSLEVEL = 6
+
+
+def _deterministic_zip_write(zip_path: Path, files: Dict[str, bytes], *, compresslevel: int = DEFAULT_ZIP_COMPRESSLEVEL) -> None:
+    """Write a deterministic zip (stable ordering + fixed timestamps).
+
+    Compression deliberately stays on stdlib zipfile/zlib: compressed bytes depend on the
+    deflate implementation, so an optional faster backend (libdeflate, zlib-ng) would make
+    the zip digest differ between environments for identical inputs. The per-entry
+    stored/deflated choice depends only on entry size, so it is input-deterministic too.
+    """
 
     zip_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Fixed earliest DOS timestamp to keep bytes stable.
     fixed_dt = (1980, 1, 1, 0, 0, 0)
 
-    with zipfile.ZipFile(zip_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+    with zipfile.ZipFile(zip_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
         for name in sorted(files.keys()):
             data = files[name]
             zi = zipfile.ZipInfo(filename=name, date_time=fixed_dt)
-            zi.compress_type = zipfile.ZIP_DEFLATED
             # Force consistent file mode bits.
             zi.external_attr = 0o644 << 16
-            zf.writestr(zi, data)
+            if len(data) < ZIP_STORE_BELOW_BYTES:
+                zf.writestr(zi, data, compress_type=zipfile.ZIP_STORED)
+            else:
+                # The level must be passed per entry: writestr() ignores the archive-level
+                # compresslevel when handed a ZipInfo.
+                zf.writestr(zi, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
 
 
 def _registry_record(r: RegistryLoadResult) -> Dict[str, Any]:
@@ -109,6 +118,7 @@ def build_release(
     include_dsse: bool = False,
     include_cyclonedx: bool = False,
     created_utc: str | None = None,
+    compresslevel: int = DEFAULT_ZIP_COMPRESSLEVEL,
 ) -> ReleaseBuildResult:
     """Build a deterministic release artifact.
 
@@ -131,50 +141,50 @@ def build_release(
     # Default to a fixed timestamp unless the caller explicitly overrides it.
     created = str(created_utc) if created_utc is not None else DETERMINISTIC_CREATED_UTC
 
+    # Registry records (path + canonical_sha256 carried by the load result) are built once
+    # and shared by the manifest, the optional BOM and the returned result.
+    records: Dict[str, Dict[str, Any]] = {
+        "components": _registry_record(comp),
+        "variants": _registry_record(var),
+        "remotes": _registry_record(rem),
+    }
+
     manifest_obj: Dict[str, Any] = {
         "type": "fieldgrade_release/1.0",
         "version": "1.0",
         "created_utc": created,
-        "registries": {
-            "components": _registry_record(comp),
-            "variants": _registry_record(var),
-            "remotes": _registry_record(rem),
-        },
+        "registries": records,
     }
 
-    manifest_canon = canonical_json(manifest_obj)
-    manifest_sha = sha256_str(manifest_canon)
+    manifest_bytes = canonical_json(manifest_obj).encode("utf-8")
+    manifest_sha = sha256_hex(manifest_bytes)
     release_id = manifest_sha[:16]
 
+    # Each payload is encoded once; the same bytes go to disk and into the zip.
+    zip_files: Dict[str, bytes] = {
+        "manifest.json": manifest_bytes,
+        "registries/components.json": comp.canonical_json.encode("utf-8"),
+        "registries/variants.json": var.canonical_json.encode("utf-8"),
+        "registries/remotes.json": rem.canonical_json.encode("utf-8"),
+    }
+
     # Write directory layout
     rel_dir = out_root / release_id
     reg_dir = rel_dir / "registries"
     reg_dir.mkdir(parents=True, exist_ok=True)
 
     manifest_path = rel_dir / "manifest.json"
-    manifest_path.write_text(manifest_canon, encoding="utf-8")
+    manifest_path.write_bytes(manifest_bytes)
 
-    (reg_dir / "components.json").write_text(comp.canonical_json, encoding="utf-8")
-    (reg_dir / "variants.json").write_text(var.canonical_json, encoding="utf-8")
-    (reg_dir / "remotes.json").write_text(rem.canonical_json, encoding="utf-8")
+    for name in ("components", "variants", "remotes"):
+        (reg_dir / f"{name}.json").write_bytes(zip_files[f"registries/{name}.json"])
 
     # Optional signed attestations (DSSE) + optional deterministic CycloneDX BOM
-    zip_files: Dict[str, bytes] = {
-        "manifest.json": manifest_canon.encode("utf-8"),
-        "registries/components.json": comp.canonical_json.encode("utf-8"),
-        "registries/variants.json": var.canonical_json.encode("utf-8"),
-        "registries/remotes.json": rem.canonical_json.encode("utf-8"),
-    }
-
     if include_cyclonedx:
         bom_obj = _build_release_cyclonedx_bom(
             release_id=release_id,
             manifest_sha256=manifest_sha,
-            registries={
-                "components": _registry_record(comp),
-                "variants": _registry_record(var),
-                "remotes": _registry_record(rem),
-            },
+            registries=records,
         )
         bom_bytes = canonical_json(bom_obj).encode("utf-8")
         zip_files["sbom/bom.cdx.json"] = bom_bytes
@@ -189,16 +199,15 @@ def build_release(
             raise ValueError("signing_key_paths_must_exist")
 
         from termite.signing import load_private_key
-        from termite.dsse import keyid_for_pubkey_pem, make_intoto_statement, sign_dsse
+        from termite.dsse import envelope_json_bytes, keyid_for_pubkey_pem, make_intoto_statement, sign_dsse
 
         pub_pem = pub_path.read_bytes()
         kid = keyid_for_pubkey_pem(pub_pem)
         signer = load_private_key(priv_path)
 
-        # Build DSSE: bind manifest digest
-        man_sha = _sha256_bytes(zip_files["manifest.json"])
+        # Build DSSE: bind manifest digest (manifest bytes are exactly what was hashed above)
         build_stmt = make_intoto_statement(
-            subjects=[{"name": "manifest.json", "digest": {"sha256": man_sha}}],
+            subjects=[{"name": "manifest.json", "digest": {"sha256": manifest_sha}}],
             predicate_type="https://mite.ecology/fieldgrade/release/v1",
             predicate={
                 "release_id": release_id,
@@ -212,11 +221,11 @@ def build_release(
             signer=signer,
             keyid=kid,
         )
-        zip_files["attestation.dsse.json"] = (canonical_json(build_env) + "\n").encode("utf-8")
+        zip_files["attestation.dsse.json"] = envelope_json_bytes(build_env) + b"\n"
 
         # SBOM DSSE: bind CycloneDX digest if present
         if "sbom/bom.cdx.json" in zip_files:
-            sbom_sha = _sha256_bytes(zip_files["sbom/bom.cdx.json"])
+            sbom_sha = sha256_hex(zip_files["sbom/bom.cdx.json"])
             sbom_stmt = make_intoto_statement(
                 subjects=[{"name": "sbom/bom.cdx.json", "digest": {"sha256": sbom_sha}}],
                 predicate_type="https://mite.ecology/fieldgrade/release-sbom/v1",
@@ -233,10 +242,10 @@ def build_release(
                 signer=signer,
                 keyid=kid,
             )
-            zip_files["sbom/bom.dsse.json"] = (canonical_json(sbom_env) + "\n").encode("utf-8")
+            zip_files["sbom/bom.dsse.json"] = envelope_json_bytes(sbom_env) + b"\n"
 
     zip_path = out_root / f"{release_id}.zip"
-    _deterministic_zip_write(zip_path, zip_files)
+    _deterministic_zip_write(zip_path, zip_files, compresslevel=compresslevel)
 
     return ReleaseBuildResult(
         release_id=release_id,
@@ -245,22 +254,17 @@ def build_release(
         out_dir=str(out_root),
         manifest_path=str(manifest_path),
         zip_path=str(zip_path),
-        registries={
-            "components": _registry_record(comp),
-            "variants": _registry_record(var),
-            "remotes": _registry_record(rem),
-        },
+        registries={k: dict(v) for k, v in records.items()},
     )
 
 
 def load_release_manifest(path: str | Path) -> Dict[str, Any]:
     p = Path(path)
-    return json.loads(p.read_text(encoding="utf-8"))
+    return json_loads(p.read_bytes())
 
 
 def release_zip_sha256(path: str | Path) -> str:
-    p = Path(path)
-    return sha256_hex(p.read_bytes())
+    return sha256_file(Path(path))
 
 
 def verify_release_zip(
@@ -269,94 +273,110 @@ def verify_release_zip(
     signing_public_key_path: str | Path | None = None,
     require_dsse: bool = False,
     require_cyclonedx: bool = False,
+    strict: bool = False,
 ) -> Dict[str, Any]:
     """Verify structural and cryptographic invariants of a release zip.
 
     - Always validates manifest sha and release_id relationship.
+    - With `strict`, additionally requires the stored manifest.json to be canonical JSON.
     - Optionally validates CycloneDX + DSSE attestations if present/required.
     """
     zp = Path(zip_path)
     if not zp.exists() or not zp.is_file():
         raise FileNotFoundError(str(zp))
 
-    with zipfile.ZipFile(zp, mode="r") as zf:
-        names = set(zf.namelist())
-        required = {
-            "manifest.json",
-            "registries/components.json",
-            "registries/variants.json",
-            "registries/remotes.json",
-        }
-        missing = sorted(required - names)
-        if missing:
-            raise ValueError(f"missing_files:{','.join(missing)}")
-
-        manifest_bytes = zf.read("manifest.json")
-        manifest_obj = json.loads(manifest_bytes.decode("utf-8"))
-        manifest_sha = sha256_str(canonical_json(manifest_obj))
-        release_id = manifest_sha[:16]
-        if zp.stem != release_id:
-            raise ValueError("release_id_mismatch")
-
-        # CycloneDX (optional)
-        has_cdx = "sbom/bom.cdx.json" in names
-        if require_cyclonedx and not has_cdx:
-            raise ValueError("missing_cyclonedx")
-
-        # DSSE (optional)
-        has_dsse = "attestation.dsse.json" in names
-        if require_dsse and not has_dsse:
-            raise ValueError("missing_dsse")
-
-        dsse_ok = False
-        sbom_dsse_ok = False
-        keyid = None
-
-        if has_dsse or ("sbom/bom.dsse.json" in names):
-            if not signing_public_key_path:
-                raise ValueError("missing_signing_public_key_path")
-            pub_path = Path(signing_public_key_path)
-            if not pub_path.exists():
-                raise ValueError("signing_public_key_not_found")
-
-            from termite.dsse import verify_dsse
-            from termite.signing import load_public_key
-
-            pub = load_public_key(pub_path)
-            keyid = _sha256_bytes(pub_path.read_bytes())
-
-            if has_dsse:
-                env = json.loads(zf.read("attestation.dsse.json").decode("utf-8"))
-                payload = verify_dsse(env, verifier=pub, expected_keyid=keyid)
-                subj = (payload.get("subject") or [])
-                if not isinstance(subj, list) or not subj:
-                    raise ValueError("dsse_payload_malformed")
-                man_digest = str(subj[0].get("digest", {}).get("sha256") or "")
-                if man_digest != _sha256_bytes(manifest_bytes):
-                    raise ValueError("dsse_manifest_digest_mismatch")
-                dsse_ok = True
-
-            if "sbom/bom.dsse.json" in names:
-                if "sbom/bom.cdx.json" not in names:
-                    raise ValueError("sbom_dsse_without_bom")
-                bom_bytes = zf.read("sbom/bom.cdx.json")
-                env = json.loads(zf.read("sbom/bom.dsse.json").decode("utf-8"))
-                payload = verify_dsse(env, verifier=pub, expected_keyid=keyid)
-                subj = (payload.get("subject") or [])
-                if not isinstance(subj, list) or not subj:
-                    raise ValueError("dsse_sbom_payload_malformed")
-                bom_digest = str(subj[0].get("digest", {}).get("sha256") or "")
-                if bom_digest != _sha256_bytes(bom_bytes):
-                    raise ValueError("dsse_sbom_digest_mismatch")
-                sbom_dsse_ok = True
-
-        return {
-            "ok": True,
-            "release_id": release_id,
-            "manifest_sha256": manifest_sha,
-            "zip_sha256": sha256_hex(zp.read_bytes()),
-            "has_cyclonedx": bool(has_cdx),
-            "dsse_ok": bool(dsse_ok),
-            "sbom_dsse_ok": bool(sbom_dsse_ok),
-            "keyid": keyid,
-        }
+    # One handle serves both the whole-file digest and the zip reads, so the digest
+    # describes exactly the bytes that were verified.
+    with open(zp, "rb") as fh:
+        zip_sha = sha256_fileobj(fh)
+        fh.seek(0)
+        with zipfile.ZipFile(fh, mode="r") as zf:
+            names = set(zf.namelist())
+            required = {
+                "manifest.json",
+                "registries/components.json",
+                "registries/variants.json",
+                "registries/remotes.json",
+            }
+            missing = sorted(required - names)
+            if missing:
+                raise ValueError(f"missing_files:{','.join(missing)}")
+
+            manifest_bytes = zf.read("manifest.json")
+            manifest_obj = json_loads(manifest_bytes)
+            # build_release stores the manifest already canonical, so hash the stored bytes and
+            # only re-canonicalize if they do not match (hand-edited / foreign manifests).
+            stored_sha = sha256_hex(manifest_bytes)
+            manifest_sha = stored_sha
+            if strict or zp.stem != manifest_sha[:16]:
+                canon = canonical_json(manifest_obj)
+                if strict and canon != manifest_bytes.decode("utf-8"):
+                    raise ValueError("manifest_not_canonical")
+                manifest_sha = sha256_str(canon)
+            release_id = manifest_sha[:16]
+            if zp.stem != release_id:
+                raise ValueError("release_id_mismatch")
+
+            # CycloneDX (optional)
+            has_cdx = "sbom/bom.cdx.json" in names
+            if require_cyclonedx and not has_cdx:
+                raise ValueError("missing_cyclonedx")
+
+            # DSSE (optional)
+            has_dsse = "attestation.dsse.json" in names
+            if require_dsse and not has_dsse:
+                raise ValueError("missing_dsse")
+
+            dsse_ok = False
+            sbom_dsse_ok = False
+            keyid = None
+
+            if has_dsse or ("sbom/bom.dsse.json" in names):
+                if not signing_public_key_path:
+                    raise ValueError("missing_signing_public_key_path")
+                pub_path = Path(signing_public_key_path)
+                if not pub_path.exists():
+                    raise ValueError("signing_public_key_not_found")
+
+                from termite.dsse import verify_dsse
+                from termite.signing import public_key_from_pem
+
+                pub_pem = pub_path.read_bytes()
+                pub = public_key_from_pem(pub_pem)
+                keyid = sha256_hex(pub_pem)
+
+                if has_dsse:
+                    env = json_loads(zf.read("attestation.dsse.json"))
+                    payload = verify_dsse(env, verifier=pub, expected_keyid=keyid)
+                    subj = (payload.get("subject") or [])
+                    if not isinstance(subj, list) or not subj:
+                        raise ValueError("dsse_payload_malformed")
+                    man_digest = str(subj[0].get("digest", {}).get("sha256") or "")
+                    if man_digest != stored_sha:
+                        raise ValueError("dsse_manifest_digest_mismatch")
+                    dsse_ok = True
+
+                if "sbom/bom.dsse.json" in names:
+                    if "sbom/bom.cdx.json" not in names:
+                        raise ValueError("sbom_dsse_without_bom")
+                    bom_bytes = zf.read("sbom/bom.cdx.json")
+                    env = json_loads(zf.read("sbom/bom.dsse.json"))
+                    payload = verify_dsse(env, verifier=pub, expected_keyid=keyid)
+                    subj = (payload.get("subject") or [])
+                    if not isinstance(subj, list) or not subj:
+                        raise ValueError("dsse_sbom_payload_malformed")
+                    bom_digest = str(subj[0].get("digest", {}).get("sha256") or "")
+                    if bom_digest != sha256_hex(bom_bytes):
+                        raise ValueError("dsse_sbom_digest_mismatch")
+                    sbom_dsse_ok = True
+
+            return {
+                "ok": True,
+                "release_id": release_id,
+                "manifest_sha256": manifest_sha,
+                "zip_sha256": zip_sha,
+                "has_cyclonedx": bool(has_cdx),
+                "dsse_ok": bool(dsse_ok),
+                "sbom_dsse_ok": bool(sbom_dsse_ok),
+                "keyid": keyid,
+            }
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import re
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
+from .hashutil import json_dumps_pretty, json_loads
+
 
 @dataclass(frozen=True)
 class RemoteSyncResult:
@@ -18,25 +21,28 @@ class RemoteSyncResult:
     skipped: bool = False
 
 
+# .../fg_next/mite_ecology/mite_ecology/remote_sync.py -> parents[2] == .../fg_next
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
 def _repo_root() -> Path:
-    # .../fg_next/mite_ecology/mite_ecology/remote_sync.py -> parents[2] == .../fg_next
-    return Path(__file__).resolve().parents[2]
+    return _REPO_ROOT
+
+
+# Unicode \w is exactly str.isalnum() plus "_", so this keeps the same characters the
+# original per-character loop kept.
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^\w.\-]")
 
 
 def _safe_remote_id(remote_id: str) -> str:
-    s = (remote_id or "").strip()
-    out = []
-    for ch in s:
-        if ch.isalnum() or ch in ("-", "_", "."):
-            out.append(ch)
-        else:
-            out.append("_")
-    return "".join(out)[:80] or "remote"
+    # Replacement is 1:1 per character, so truncating first gives the same result.
+    s = (remote_id or "").strip()[:80]
+    return _UNSAFE_ID_CHARS_RE.sub("_", s) or "remote"
 
 
 def _read_json(path: Path) -> Optional[Dict[str, Any]]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except Exception:
         return None
 
@@ -44,10 +50,24 @@ def _read_json(path: Path) -> Optional[Dict[str, Any]]:
 def _write_json(path: Path, obj: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(obj, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.write_bytes(json_dumps_pretty(obj))
     tmp.replace(path)
 
 
+def _status_obj(result: RemoteSyncResult) -> Dict[str, Any]:
+    # Fields are flat apart from `targets`, whose values are only serialized here, so a
+    # direct dict avoids asdict()'s recursive deep copy.
+    return {
+        "remote_id": result.remote_id,
+        "ok": result.ok,
+        "ts": result.ts,
+        "tuf_base": result.tuf_base,
+        "targets": result.targets,
+        "error": result.error,
+        "skipped": result.skipped,
+    }
+
+
 def status_path(cache_root: str | Path, remote_id: str) -> Path:
     rid = _safe_remote_id(remote_id)
     return Path(cache_root) / rid / "status.json"
@@ -102,6 +122,10 @@ def sync_remote(
       - {cache_root}/{remote_id}/targets/*.yaml (downloaded and verified)
     """
 
+    # One clock read serves every result produced before network work starts; results
+    # after the TUF refresh/downloads take a fresh reading so `ts` reflects completion.
+    now = time.time()
+
     remote_id = (remote.get("remote_id") or "").strip()
     tuf_base = (remote.get("tuf_base") or "").strip()
 
@@ -113,7 +137,7 @@ def sync_remote(
         return RemoteSyncResult(
             remote_id=remote_id or "(missing)",
             ok=False,
-            ts=time.time(),
+            ts=now,
             tuf_base=tuf_base,
             targets={},
             error="missing_remote_id_or_tuf_base",
@@ -123,7 +147,7 @@ def sync_remote(
         return RemoteSyncResult(
             remote_id=remote_id,
             ok=False,
-            ts=time.time(),
+            ts=now,
             tuf_base=tuf_base,
             targets={},
             error="missing_trust_root_path",
@@ -135,16 +159,16 @@ def sync_remote(
 
     if ttl_seconds and ttl_seconds > 0 and st_path.exists():
         try:
-            age = time.time() - st_path.stat().st_mtime
+            age = now - st_path.stat().st_mtime
             if age < ttl_seconds:
                 prev = _read_json(st_path) or {}
                 prev["skipped"] = True
-                prev["ts"] = time.time()
+                prev["ts"] = now
                 _write_json(st_path, prev)
                 return RemoteSyncResult(
                     remote_id=remote_id,
                     ok=bool(prev.get("ok")),
-                    ts=float(prev.get("ts") or time.time()),
+                    ts=now,
                     tuf_base=tuf_base,
                     targets=dict(prev.get("targets") or {}),
                     error=prev.get("error"),
@@ -164,7 +188,7 @@ def sync_remote(
         return RemoteSyncResult(
             remote_id=remote_id,
             ok=False,
-            ts=time.time(),
+            ts=now,
             tuf_base=tuf_base,
             targets={},
             error=f"tuf_unavailable: {e}",
@@ -204,13 +228,16 @@ def sync_remote(
         updater.refresh()
 
         targets_cfg = _target_map(remote)
-        out_targets: Dict[str, Dict[str, Any]] = {}
 
-        def _dl(kind: str, tpath: str) -> None:
-            info = updater.get_targetinfo(tpath)
+        # Target lookup may lazily load delegated metadata inside the Updater, so resolve
+        # target infos serially; the independent downloads + registry validation then run
+        # concurrently. Entries are collected in targets_cfg order.
+        infos = [(kind, tpath, updater.get_targetinfo(tpath)) for kind, tpath in targets_cfg.items()]
+
+        def _dl(job: tuple[str, str, Any]) -> Dict[str, Any]:
+            kind, tpath, info = job
             if info is None:
-                out_targets[kind] = {"ok": False, "error": f"target_not_found: {tpath}", "path": None}
-                return
+                return {"ok": False, "error": f"target_not_found: {tpath}", "path": None}
             dest = targets_dir / f"{kind}.yaml"
             updater.download_target(info, filepath=str(dest))
 
@@ -222,15 +249,16 @@ def sync_remote(
             else:
                 r = load_remotes_registry(dest)
 
-            out_targets[kind] = {
+            return {
                 "ok": True,
                 "target_path": tpath,
                 "path": str(dest),
                 "canonical_sha256": r.canonical_sha256,
             }
 
-        for kind, tpath in targets_cfg.items():
-            _dl(kind, tpath)
+        with ThreadPoolExecutor(max_workers=max(1, len(infos)), thread_name_prefix="remote-dl") as ex:
+            entries = list(ex.map(_dl, infos))
+        out_targets: Dict[str, Dict[str, Any]] = {kind: entry for (kind, _t, _i), entry in zip(infos, entries)}
 
         ok = all(v.get("ok") is True for v in out_targets.values())
         result = RemoteSyncResult(
@@ -242,7 +270,7 @@ def sync_remote(
             error=None if ok else "one_or_more_targets_failed",
         )
 
-        _write_json(st_path, asdict(result))
+        _write_json(st_path, _status_obj(result))
         return result
 
     except Exception as e:
@@ -255,7 +283,7 @@ def sync_remote(
             error=f"sync_failed: {e}",
         )
         try:
-            _write_json(st_path, asdict(result))
+            _write_json(st_path, _status_obj(result))
         except Exception:
             pass
         return result
@@ -266,10 +294,17 @@ def sync_all_remotes(
     *,
     cache_root: str | Path,
     only_remote_id: str | None = None,
+    max_workers: int | None = None,
 ) -> list[RemoteSyncResult]:
-    out: list[RemoteSyncResult] = []
+    """Sync every enabled remote; results are returned in input order.
+
+    Remotes are independent and network-bound, so they run on a thread pool
+    (`max_workers`, default min(8, n)). Entries that map to the same cache directory
+    are synced sequentially within one worker so they never race on status.json.
+    """
     want = (only_remote_id or "").strip()
 
+    jobs: list[tuple[Dict[str, Any], int]] = []
     for r in remotes:
         if not isinstance(r, dict):
             continue
@@ -286,6 +321,25 @@ def sync_all_remotes(
         if isinstance(ttl_val, int):
             ttl = ttl_val
 
-        out.append(sync_remote(r, cache_root=cache_root, ttl_seconds=ttl))
+        jobs.append((r, ttl))
+
+    workers = min(8, len(jobs)) if max_workers is None else min(int(max_workers), len(jobs))
+    if workers <= 1:
+        return [sync_remote(r, cache_root=cache_root, ttl_seconds=ttl) for r, ttl in jobs]
+
+    groups: Dict[str, list[int]] = {}
+    for i, (r, _ttl) in enumerate(jobs):
+        groups.setdefault(_safe_remote_id((r.get("remote_id") or "").strip()), []).append(i)
+
+    out: list[Optional[RemoteSyncResult]] = [None] * len(jobs)
+
+    def _run_group(idxs: list[int]) -> None:
+        for i in idxs:
+            r, ttl = jobs[i]
+            out[i] = sync_remote(r, cache_root=cache_root, ttl_seconds=ttl)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="remote-sync") as ex:
+        for fut in [ex.submit(_run_group, idxs) for idxs in groups.values()]:
+            fut.result()
 
-    return out
+    return [res for res in out if res is not None]
@@ -1,64 +1,111 @@
 from __future__ import annotations
 
+import hashlib
 import sqlite3
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 from .db import connect, init_db
 from .kg import KnowledgeGraph
 from .delta import apply_delta_lines
-from .hashutil import canonical_json
+from .hashutil import canonical_json, json_str
 
 
-def sha256_str(s: str) -> str:
-    import hashlib
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+_SNAPSHOT_FETCH = 10_000
+
+
+def _hash_table_rows(h: Any, con: sqlite3.Connection, table: str) -> None:
+    """Feed `table`'s rows into `h` as the comma-joined body of a canonical JSON array.
+
+    Columns are selected explicitly in sorted-name order, so each row tuple lines up with
+    precomputed '"col":' key fragments and is emitted as canonical JSON without building
+    a dict per row.
+    """
+    cols = sorted(str(r[1]) for r in con.execute(f"PRAGMA table_info({table})"))
+    prefixes = [canonical_json(c) + ":" for c in cols]
+    select = ",".join('"' + c.replace('"', '""') + '"' for c in cols)
+
+    def row_json(row: Any) -> str:
+        return "{" + ",".join(
+            k + (json_str(v) if type(v) is str else canonical_json(v)) for k, v in zip(prefixes, row)
+        ) + "}"
+
+    cur = con.execute(f"SELECT {select} FROM {table} ORDER BY id")
+    cur.row_factory = None  # plain tuples
+    sep = ""
+    while True:
+        rows = cur.fetchmany(_SNAPSHOT_FETCH)
+        if not rows:
+            break
+        h.update((sep + ",".join(map(row_json, rows))).encode("utf-8"))
+        sep = ","
 
 
 def snapshot_hash(con: sqlite3.Connection) -> str:
-    """Stable snapshot of KG tables for deterministic replay verification."""
-    nodes = [dict(r) for r in con.execute("SELECT * FROM nodes ORDER BY id").fetchall()]
-    edges = [dict(r) for r in con.execute("SELECT * FROM edges ORDER BY id").fetchall()]
-    payload = canonical_json({"nodes": nodes, "edges": edges})
-    return sha256_str(payload)
+    """Stable snapshot of KG tables for deterministic replay verification.
+
+    Equivalent to sha256(canonical_json({"nodes": [...], "edges": [...]})) over every row,
+    but streamed into the hasher in batches so the tables are never materialized at once.
+    """
+    h = hashlib.sha256()
+    # canonical_json sorts keys, so "edges" precedes "nodes".
+    h.update(b'{"edges":[')
+    _hash_table_rows(h, con, "edges")
+    h.update(b'],"nodes":[')
+    _hash_table_rows(h, con, "nodes")
+    h.update(b"]}")
+    return h.hexdigest()
 
 
 def verify_hash_chains(con: sqlite3.Connection) -> Dict[str, object]:
     """Verify internal hash-chains for kg_deltas and ingested_bundles."""
+    # Rows are streamed from the cursor as plain tuples and each link is hashed in a single
+    # sha256() call; the first broken link stops the scan.
+    sha256 = hashlib.sha256
+
     # kg_deltas chain
     ok_deltas = True
     prev = None
-    rows = con.execute(
-        "SELECT id, delta_hash, prev_hash, chain_hash FROM kg_deltas ORDER BY id"
-    ).fetchall()
-    for r in rows:
-        if (r["prev_hash"] or None) != prev:
+    cur = con.execute("SELECT delta_hash, prev_hash, chain_hash FROM kg_deltas ORDER BY id")
+    for delta_hash, prev_hash, chain_hash in cur:
+        if (prev_hash or None) != prev:
             ok_deltas = False
             break
-        blob = (prev or "") + "|" + str(r["delta_hash"])
-        expect = sha256_str(blob)
-        if str(r["chain_hash"]) != expect:
+        delta_hash = str(delta_hash)
+        expect = sha256(((prev or "") + "|" + delta_hash).encode("utf-8")).hexdigest()
+        if str(chain_hash) != expect:
             ok_deltas = False
             break
-        prev = str(r["delta_hash"])
+        prev = delta_hash
+    cur.close()
 
     # ingested_bundles chain
     ok_ing = True
     prev = None
-    rows = con.execute(
-        "SELECT id, bundle_sha256, kg_delta_hash, ingest_kind, policy_hash, allowlist_hash, prev_hash, ingest_hash "
+    cur = con.execute(
+        "SELECT bundle_sha256, kg_delta_hash, ingest_kind, policy_hash, allowlist_hash, prev_hash, ingest_hash "
         "FROM ingested_bundles ORDER BY id"
-    ).fetchall()
-    for r in rows:
-        if (r["prev_hash"] or None) != prev:
+    )
+    for bundle_sha256, kg_delta_hash, ingest_kind, policy_hash, allowlist_hash, prev_hash, ingest_hash in cur:
+        if (prev_hash or None) != prev:
             ok_ing = False
             break
-        blob = (prev or "") + "|" + str(r["bundle_sha256"]) + "|" + str(r["kg_delta_hash"]) + "|" + str(r["ingest_kind"]) + "|" + str(r["policy_hash"]) + "|" + str(r["allowlist_hash"])
-        expect = sha256_str(blob)
-        if str(r["ingest_hash"]) != expect:
+        blob = "|".join(
+            (
+                prev or "",
+                str(bundle_sha256),
+                str(kg_delta_hash),
+                str(ingest_kind),
+                str(policy_hash),
+                str(allowlist_hash),
+            )
+        )
+        expect = sha256(blob.encode("utf-8")).hexdigest()
+        if str(ingest_hash) != expect:
             ok_ing = False
             break
-        prev = str(r["ingest_hash"])
+        prev = str(ingest_hash)
+    cur.close()
 
     return {"kg_deltas_chain_ok": ok_deltas, "ingested_chain_ok": ok_ing}
 
@@ -69,16 +116,20 @@ def replay_verify(db_path: Path) -> Dict[str, object]:
 
     mem = sqlite3.connect(":memory:")
     mem.row_factory = sqlite3.Row
+    # Throwaway DB: no durability needed, keep the rollback journal in RAM.
+    mem.execute("PRAGMA journal_mode=MEMORY")
+    mem.execute("PRAGMA synchronous=OFF")
+    mem.execute("PRAGMA temp_store=MEMORY")
     init_db(mem, Path(__file__).resolve().parents[1] / "sql" / "schema.sql")
 
     kg = KnowledgeGraph(mem)
-    deltas = [
-        str(r["delta_payload"])
-        for r in con.execute("SELECT delta_payload FROM kg_deltas ORDER BY id").fetchall()
-    ]
-    for payload in deltas:
-        lines = [ln for ln in payload.splitlines() if ln.strip()]
-        apply_delta_lines(kg, lines)
+    deltas_count = 0
+    # One transaction for the whole replay instead of a commit per applied op.
+    with kg.batch():
+        for (payload,) in con.execute("SELECT delta_payload FROM kg_deltas ORDER BY id"):
+            lines = [ln for ln in str(payload).splitlines() if ln.strip()]
+            apply_delta_lines(kg, lines)
+            deltas_count += 1
 
     replayed = snapshot_hash(mem)
     chains = verify_hash_chains(con)
@@ -88,5 +139,5 @@ def replay_verify(db_path: Path) -> Dict[str, object]:
         "replayed_snapshot_hash": replayed,
         "match": current == replayed,
         **chains,
-        "deltas_count": len(deltas),
+        "deltas_count": deltas_count,
     }
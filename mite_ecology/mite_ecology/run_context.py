@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import uuid
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import asdict, dataclass
@@ -21,20 +20,30 @@ class RunContext:
         return asdict(self)
 
 
+def _clean_env_id(raw: Optional[str]) -> Optional[str]:
+    return (raw or "").strip() or None
+
+
+# os.environ is read on every call, so in-process changes are honoured.
 def _env_run_id() -> Optional[str]:
-    return (os.environ.get("FG_RUN_ID") or os.environ.get("FIELDGRADE_RUN_ID") or "").strip() or None
+    return _clean_env_id(os.environ.get("FG_RUN_ID") or os.environ.get("FIELDGRADE_RUN_ID"))
 
 
 def _env_trace_id() -> Optional[str]:
-    return (os.environ.get("FG_TRACE_ID") or os.environ.get("FIELDGRADE_TRACE_ID") or "").strip() or None
+    return _clean_env_id(os.environ.get("FG_TRACE_ID") or os.environ.get("FIELDGRADE_TRACE_ID"))
 
 
 def _new_id() -> str:
-    return uuid.uuid4().hex
+    # 32 lowercase hex chars like uuid4().hex, without building a UUID object.
+    return os.urandom(16).hex()
 
 
 def get_run_id(*, create: bool = True) -> str:
-    rid = _run_id_var.get() or _env_run_id()
+    # Fast path: an ID set via run_context()/a previous call needs no env lookup.
+    rid = _run_id_var.get()
+    if rid:
+        return rid
+    rid = _env_run_id()
     if rid:
         return rid
     if not create:
@@ -45,7 +54,10 @@ def get_run_id(*, create: bool = True) -> str:
 
 
 def get_trace_id(*, create: bool = True) -> str:
-    tid = _trace_id_var.get() or _env_trace_id()
+    tid = _trace_id_var.get()
+    if tid:
+        return tid
+    tid = _env_trace_id()
     if tid:
         return tid
     if not create:
@@ -1,26 +1,43 @@
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import json
 
-import jsonschema
+from .hashutil import json_loads
+
+if TYPE_CHECKING:  # imported lazily at runtime: jsonschema's import chain is slow
+    import jsonschema
+
+try:  # optional: schema compiled to Python code, much faster on the all-valid path
+    import fastjsonschema as _fastjsonschema
+except ImportError:  # pragma: no cover
+    _fastjsonschema = None
 
 import re
 # Additional lint (beyond JSON Schema)
-_LDNA_RE = re.compile(r"^ldna://([a-z0-9+._-]+)/([a-zA-Z0-9._-]+)@([0-9]+\.[0-9]+\.[0-9]+)$")
-_SAFE_ID_RE = re.compile(r"^[A-Za-z0-9._:/\-]{3,256}$")
+# One pass decides all three cases: no match -> not LDNA; prefix-only match
+# (group 1 is None) -> malformed LDNA; full match -> parsed. \Z (not $) so a
+# trailing newline cannot slip through.
+_LDNA_RE = re.compile(r"ldna://(?:([a-z0-9+._-]+)/([a-zA-Z0-9._-]+)@([0-9]+\.[0-9]+\.[0-9]+)\Z)?")
+_SAFE_ID_RE = re.compile(r"[A-Za-z0-9._:/\-]{3,256}\Z")
+# Bound matchers: skip the attribute lookup on every lint call.
+_LDNA_MATCH = _LDNA_RE.match
+_SAFE_ID_MATCH = _SAFE_ID_RE.match
 
 def _lint_ldna(schema_str: str) -> str | None:
-    if not schema_str:
+    if not isinstance(schema_str, str) or not schema_str:
         return "schema must be non-empty"
-    if schema_str.startswith("ldna://"):
-        if not _LDNA_RE.match(schema_str):
-            return "invalid LDNA URI; expected ldna://<media>/<name>@<X.Y.Z>"
-        return None
-    return "non-LDNA schema id; prefer ldna:// URIs"
+    m = _LDNA_MATCH(schema_str)
+    if m is None:
+        return "non-LDNA schema id; prefer ldna:// URIs"
+    return None if m.group(1) is not None else "invalid LDNA URI; expected ldna://<media>/<name>@<X.Y.Z>"
 
 
 
@@ -34,89 +51,221 @@ def _lint_ldna(schema_str: str) -> str | None:
 # while also shipping copies under repo-root /schemas/ for tooling/editor use.
 # ---------------------------------------------------------------------------
 
-STUDSPEC_V1_SCHEMA: Dict[str, Any] = {
+# The schemas are kept as JSON text: the C decoder builds them faster than the
+# equivalent dict-literal bytecode, and each parse yields an independent copy.
+_STUDSPEC_V1_JSON = r"""
+{
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "$id": "https://mite-ecology.local/schemas/studspec_v1.json",
     "title": "StudSpec v1",
     "type": "object",
-    "required": ["studspec", "memite_id", "kind", "io", "constraints"],
+    "required": [
+        "studspec",
+        "memite_id",
+        "kind",
+        "io",
+        "constraints"
+    ],
     "properties": {
-        "studspec": {"type": "string", "const": "1.0"},
-        "memite_id": {"type": "string", "minLength": 3},
+        "studspec": {
+            "type": "string",
+            "const": "1.0"
+        },
+        "memite_id": {
+            "type": "string",
+            "minLength": 3
+        },
         "kind": {
             "type": "string",
-            "enum": ["frontend", "backend", "db", "filler", "evaluator", "tool", "pipeline"],
+            "enum": [
+                "frontend",
+                "backend",
+                "db",
+                "filler",
+                "evaluator",
+                "tool",
+                "pipeline"
+            ]
         },
         "io": {
             "type": "object",
-            "required": ["inputs", "outputs"],
+            "required": [
+                "inputs",
+                "outputs"
+            ],
             "properties": {
-                "inputs": {"type": "array", "items": {"$ref": "#/$defs/ioPort"}},
-                "outputs": {"type": "array", "items": {"$ref": "#/$defs/ioPort"}},
+                "inputs": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/$defs/ioPort"
+                    }
+                },
+                "outputs": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/$defs/ioPort"
+                    }
+                }
             },
-            "additionalProperties": True,
+            "additionalProperties": true
         },
         "constraints": {
             "type": "object",
-            "required": ["determinism"],
+            "required": [
+                "determinism"
+            ],
             "properties": {
-                "determinism": {"type": "string", "enum": ["strict", "bounded", "best_effort"]},
-                "max_ram_mb": {"type": "integer", "minimum": 0},
-                "max_latency_ms": {"type": "integer", "minimum": 0},
-                "side_effects": {"type": "array", "items": {"type": "string"}},
+                "determinism": {
+                    "type": "string",
+                    "enum": [
+                        "strict",
+                        "bounded",
+                        "best_effort"
+                    ]
+                },
+                "max_ram_mb": {
+                    "type": "integer",
+                    "minimum": 0
+                },
+                "max_latency_ms": {
+                    "type": "integer",
+                    "minimum": 0
+                },
+                "side_effects": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                }
             },
-            "additionalProperties": True,
+            "additionalProperties": true
+        },
+        "deps": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
         },
-        "deps": {"type": "array", "items": {"type": "string"}},
-        "provenance": {"type": "object"},
-        "attestation": {"type": "object"},
+        "provenance": {
+            "type": "object"
+        },
+        "attestation": {
+            "type": "object"
+        }
     },
     "$defs": {
         "ioPort": {
             "type": "object",
-            "required": ["name", "schema"],
+            "required": [
+                "name",
+                "schema"
+            ],
             "properties": {
-                "name": {"type": "string", "minLength": 1},
-                "schema": {"type": "string", "minLength": 1},
-                "optional": {"type": "boolean"},
+                "name": {
+                    "type": "string",
+                    "minLength": 1
+                },
+                "schema": {
+                    "type": "string",
+                    "minLength": 1
+                },
+                "optional": {
+                    "type": "boolean"
+                }
             },
-            "additionalProperties": True,
+            "additionalProperties": true
         }
     },
-    "additionalProperties": True,
+    "additionalProperties": true
 }
+"""
 
-TUBESPEC_V1_SCHEMA: Dict[str, Any] = {
+_TUBESPEC_V1_JSON = r"""
+{
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "$id": "https://mite-ecology.local/schemas/tubespec_v1.json",
     "title": "TubeSpec v1",
     "type": "object",
-    "required": ["tubespec", "runtime", "deps"],
+    "required": [
+        "tubespec",
+        "runtime",
+        "deps"
+    ],
     "properties": {
-        "tubespec": {"type": "string", "const": "1.0"},
+        "tubespec": {
+            "type": "string",
+            "const": "1.0"
+        },
         "runtime": {
             "type": "object",
-            "required": ["python"],
+            "required": [
+                "python"
+            ],
             "properties": {
-                "python": {"type": "string"},
-                "os": {"type": "string"},
-                "arch": {"type": "string"},
-                "device": {"type": "string"},
-                "accelerators": {"type": "array", "items": {"type": "string"}},
+                "python": {
+                    "type": "string"
+                },
+                "os": {
+                    "type": "string"
+                },
+                "arch": {
+                    "type": "string"
+                },
+                "device": {
+                    "type": "string"
+                },
+                "accelerators": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                }
             },
-            "additionalProperties": True,
+            "additionalProperties": true
+        },
+        "deps": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "assets": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "limits": {
+            "type": "object"
         },
-        "deps": {"type": "array", "items": {"type": "string"}},
-        "assets": {"type": "array", "items": {"type": "string"}},
-        "limits": {"type": "object"},
-        "compat": {"type": "object"},
-        "notes": {"type": "string"},
+        "compat": {
+            "type": "object"
+        },
+        "notes": {
+            "type": "string"
+        }
     },
-    "additionalProperties": True,
+    "additionalProperties": true
 }
+"""
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
 
 
-@dataclass(frozen=True)
+# Read-only public views; the validators below work on private plain-dict copies
+# (jsonschema's metaschema check requires real dicts), so mutating callers cannot
+# invalidate them.
+STUDSPEC_V1_SCHEMA: Mapping[str, Any] = _freeze(json.loads(_STUDSPEC_V1_JSON))
+TUBESPEC_V1_SCHEMA: Mapping[str, Any] = _freeze(json.loads(_TUBESPEC_V1_JSON))
+
+
+@dataclass(frozen=True, slots=True)
 class SpecIssue:
     path: str
     message: str
@@ -124,35 +273,212 @@ class SpecIssue:
     severity: str = "error"
 
 
-def _collect_issues(schema: Dict[str, Any], instance: Dict[str, Any]) -> List[SpecIssue]:
-    v = jsonschema.Draft202012Validator(schema)
-    issues: List[SpecIssue] = []
-    for e in sorted(v.iter_errors(instance), key=lambda x: x.path):
-        p = "/" + "/".join(map(str, e.absolute_path)) if e.absolute_path else "/"
-        issues.append(SpecIssue(path=p, message=e.message))
-    return issues
+@functools.lru_cache(maxsize=None)
+def _builtin_registry() -> Tuple[Dict[str, Dict[str, Any]], Any]:
+    """Both built-in schemas and one shared referencing.Registry holding them by $id."""
+    from referencing import Registry
+    from referencing.jsonschema import DRAFT202012
+
+    schemas = {"stud": json.loads(_STUDSPEC_V1_JSON), "tube": json.loads(_TUBESPEC_V1_JSON)}
+    registry = Registry().with_resources(
+        (s["$id"], DRAFT202012.create_resource(s)) for s in schemas.values()
+    ).crawl()
+    return schemas, registry
+
+
+# Keywords fastjsonschema (drafts 4/6/7) evaluates the same way jsonschema does under
+# Draft 2020-12. Anything else (dependentRequired, prefixItems, unevaluated*, array
+# `items`, ...) could be silently ignored by the fast path and accept a bad document.
+_FAST_SAFE_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "default", "examples",
+    "readOnly", "writeOnly", "deprecated", "$defs", "definitions",
+    "type", "enum", "const", "format",
+    "properties", "patternProperties", "additionalProperties", "propertyNames",
+    "required", "minProperties", "maxProperties",
+    "items", "minItems", "maxItems", "uniqueItems", "contains",
+    "minLength", "maxLength", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf",
+    "allOf", "anyOf", "oneOf", "not", "if", "then", "else",
+})
+_REF_SIBLINGS_OK = frozenset({"$ref", "$comment", "title", "description"})
+_SUBSCHEMA_KEYS = ("additionalProperties", "propertyNames", "items", "contains", "not", "if", "then", "else")
+_SUBSCHEMA_MAPS = ("properties", "patternProperties", "$defs", "definitions")
+_SUBSCHEMA_LISTS = ("allOf", "anyOf", "oneOf")
+
+
+def _fast_path_safe(schema: Any) -> bool:
+    """True if every keyword in `schema` means the same to fastjsonschema and jsonschema.
+
+    $ref must stand alone (draft 7 ignores its siblings; 2020-12 applies them).
+    """
+    if isinstance(schema, bool):
+        return True
+    if not isinstance(schema, dict):
+        return False
+    if "$ref" in schema:
+        return _REF_SIBLINGS_OK.issuperset(schema)
+    if not _FAST_SAFE_KEYWORDS.issuperset(schema):
+        return False
+    for k in _SUBSCHEMA_KEYS:
+        if k in schema and not (isinstance(schema[k], (dict, bool)) and _fast_path_safe(schema[k])):
+            return False
+    for k in _SUBSCHEMA_MAPS:
+        if k in schema and not all(_fast_path_safe(sub) for sub in schema[k].values()):
+            return False
+    for k in _SUBSCHEMA_LISTS:
+        if k in schema and not all(_fast_path_safe(sub) for sub in schema[k]):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _validators(kind: str) -> Tuple[Any, jsonschema.Draft202012Validator]:
+    """(fast accept fn or None, jsonschema validator) for a built-in spec kind.
 
+    Built once, on first use, so importing this module does not pay for jsonschema.
+    fastjsonschema stops at the first error, so it only decides "valid"; invalid
+    documents are re-run through jsonschema to report the full, stable issue list.
+    It implements drafts 4/6/7 only, so it is used only when _fast_path_safe().
+    """
+    import jsonschema
 
-def validate_studspec(obj: Dict[str, Any]) -> List[SpecIssue]:
-    return _collect_issues(STUDSPEC_V1_SCHEMA, obj)
+    src = _STUDSPEC_V1_JSON if kind == "stud" else _TUBESPEC_V1_JSON
+    schemas, registry = _builtin_registry()
+    schema = schemas[kind]
+    jsonschema.Draft202012Validator.check_schema(schema)
+    # compile() rewrites $refs in place, so it gets its own parse of the schema.
+    fast = None
+    if _fastjsonschema is not None and _fast_path_safe(schema):
+        fast = _fastjsonschema.compile(json.loads(src))
+    return fast, jsonschema.Draft202012Validator(schema, registry=registry)
 
 
-def validate_tubespec(obj: Dict[str, Any]) -> List[SpecIssue]:
-    return _collect_issues(TUBESPEC_V1_SCHEMA, obj)
+@functools.lru_cache(maxsize=128)
+def _validator_for_json(schema_json: str) -> jsonschema.Draft202012Validator:
+    import jsonschema
+
+    return jsonschema.Draft202012Validator(json.loads(schema_json))
+
+
+def validator_for(schema: Dict[str, Any]) -> jsonschema.Draft202012Validator:
+    """Return a (cached) Draft 2020-12 validator for an ad-hoc schema dict."""
+    return _validator_for_json(json.dumps(schema, sort_keys=True))
+
+
+_ROOT_PTR = "/"
+
+
+def _jsonptr(path: Tuple[Any, ...]) -> str:
+    # Keeps the repo's "/a/0/b" form; ValidationError.json_path would be "$.a[0].b".
+    # Segments are emitted as-is (no RFC 6901 "~" escaping), as before.
+    if not path:
+        return _ROOT_PTR
+    return "/" + "/".join([str(seg) for seg in path])
+
+
+def _collect_issues(
+    v: jsonschema.Draft202012Validator, instance: Dict[str, Any], *, fail_fast: bool = False
+) -> List[SpecIssue]:
+    errs = v.iter_errors(instance)
+    if fail_fast:
+        # Stop the traversal at the first error; callers only need ok/not-ok.
+        e = next(errs, None)
+        keyed = [] if e is None else [(tuple(e.absolute_path), e.message)]
+    else:
+        keyed = [(tuple(e.absolute_path), e.message) for e in errs]
+        keyed.sort(key=lambda kv: kv[0])
+    return [SpecIssue(path=_jsonptr(p), message=msg) for p, msg in keyed]
+
+
+def _is_valid(fast: Any, v: jsonschema.Draft202012Validator, instance: Dict[str, Any]) -> bool:
+    # Happy path: a short-circuiting yes/no check, no error objects or SpecIssues built.
+    if fast is None:
+        return v.is_valid(instance)
+    try:
+        fast(instance)
+    except _fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+def validate_studspec(obj: Dict[str, Any], *, fail_fast: bool = False) -> List[SpecIssue]:
+    fast, v = _validators("stud")
+    if _is_valid(fast, v, obj):
+        return []
+    return _collect_issues(v, obj, fail_fast=fail_fast)
+
+
+def validate_tubespec(obj: Dict[str, Any], *, fail_fast: bool = False) -> List[SpecIssue]:
+    fast, v = _validators("tube")
+    if _is_valid(fast, v, obj):
+        return []
+    return _collect_issues(v, obj, fail_fast=fail_fast)
+
+
+def _load_json_fast(abs_path: str | Path) -> Dict[str, Any]:
+    # Trusted absolute path: no resolve(). Parse the raw bytes (no intermediate str,
+    # orjson when installed).
+    with open(abs_path, "rb") as f:
+        return json_loads(f.read())
 
 
 def load_json(path: str | Path) -> Dict[str, Any]:
-    p = Path(path).resolve()
-    return json.loads(p.read_text(encoding="utf-8"))
+    return _load_json_fast(Path(path).resolve())
 
 
-def validate_spec_file(kind: str, path: str | Path) -> Tuple[bool, List[SpecIssue]]:
-    obj = load_json(path)
-    kind = kind.lower().strip()
-    if kind in ("stud", "studspec"):
-        issues = validate_studspec(obj)
-    elif kind in ("tube", "tubespec"):
-        issues = validate_tubespec(obj)
+def _norm_kind(kind: str) -> str:
+    k = kind.lower().strip()
+    if k in ("stud", "studspec"):
+        return "stud"
+    if k in ("tube", "tubespec"):
+        return "tube"
+    raise ValueError(f"unknown_spec_kind:{k}")
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_spec_file_cached(
+    kind: str, path_str: str, mtime_ns: int, size: int, fail_fast: bool
+) -> Tuple[bool, Tuple[SpecIssue, ...]]:
+    # mtime_ns/size are part of the key only: an edited file gets a fresh entry.
+    obj = _load_json_fast(path_str)
+    if kind == "stud":
+        issues = validate_studspec(obj, fail_fast=fail_fast)
     else:
-        raise ValueError(f"unknown_spec_kind:{kind}")
-    return (len(issues) == 0), issues
+        issues = validate_tubespec(obj, fail_fast=fail_fast)
+    return (len(issues) == 0), tuple(issues)
+
+
+def validate_spec_file(kind: str, path: str | Path, *, fail_fast: bool = False) -> Tuple[bool, List[SpecIssue]]:
+    """Validate a spec file; with fail_fast=True at most the first issue is reported.
+
+    Results are memoized by (kind, absolute path, mtime_ns, size).
+    """
+    kind = _norm_kind(kind)
+    p = Path(path)
+    if not p.is_absolute():
+        p = p.resolve()
+    st = os.stat(p)
+    ok, issues = _validate_spec_file_cached(kind, str(p), st.st_mtime_ns, st.st_size, fail_fast)
+    return ok, list(issues)
+
+
+def validate_many(
+    kind: str, objs: Iterable[Dict[str, Any]], *, fail_fast: bool = False
+) -> List[List[SpecIssue]]:
+    """Validate many spec objects of one kind, resolving the validators once."""
+    fast, v = _validators(_norm_kind(kind))
+    return [[] if _is_valid(fast, v, o) else _collect_issues(v, o, fail_fast=fail_fast) for o in objs]
+
+
+def validate_spec_files(
+    kind: str, paths: Iterable[str | Path], *, max_workers: int = 4
+) -> List[Tuple[bool, List[SpecIssue]]]:
+    """validate_spec_file over many paths; file reads/parses overlap in a thread pool.
+
+    Results are returned in input order.
+    """
+    paths = list(paths)
+    if len(paths) <= 1 or max_workers <= 1:
+        return [validate_spec_file(kind, p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as ex:
+        return list(ex.map(lambda p: validate_spec_file(kind, p), paths))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import json
+import shutil
 import sys
 import zipfile
 from pathlib import Path
@@ -33,13 +34,16 @@ def _write_zip_variant(
                 name = info.filename
                 if name in remove:
                     continue
-                data = replace.get(name)
-                if data is None:
-                    data = zin.read(name)
                 new_info = zipfile.ZipInfo(name)
                 new_info.date_time = info.date_time
                 new_info.compress_type = info.compress_type
-                zout.writestr(new_info, data)
+                data = replace.get(name)
+                if data is not None:
+                    zout.writestr(new_info, data)
+                    continue
+                # Unchanged member: stream it across instead of materialising it in memory.
+                with zin.open(info) as src, zout.open(new_info, "w") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
 
 
 def _make_policy_and_allowlist(
@@ -98,13 +102,15 @@ def _build_minimal_signed_bundle(
     *,
     require_dsse: bool,
     require_cdx: bool,
+    digest_algo: str = "sha256",
+    raw_blobs: tuple[bytes, ...] = (),
 ) -> tuple[Path, Path, Path]:
     from termite.cas import CAS
-    from termite.db import connect as t_connect, init_db as t_init_db
+    from termite.db import connect as t_connect, init_db as t_init_db, insert_kg_ops
     from termite.bundle import SealInputs, build_bundle
     from termite.policy import load_policy, canonical_hash_dict
     from termite.tools import load_allowlist
-    from termite.provenance import utc_now_iso
+    from termite.provenance import hash_str, utc_now_iso
 
     policy_path, allowlist_path = _make_policy_and_allowlist(
         tmp_path,
@@ -114,7 +120,8 @@ def _build_minimal_signed_bundle(
 
     pol = load_policy(policy_path)
     allow = load_allowlist(allowlist_path)
-    allow_for_hash = {k: v for k, v in allow.items() if k != "_base_dir"}
+    allow_for_hash = dict(allow)
+    allow_for_hash.pop("_base_dir", None)
 
     keys_dir = tmp_path / "keys"
     priv_path = keys_dir / "test_priv.pem"
@@ -124,6 +131,8 @@ def _build_minimal_signed_bundle(
     t_db = t_dir / "termite.sqlite"
     t_cas = CAS(t_dir / "cas")
     t_cas.init()
+    for blob in raw_blobs:
+        t_cas.put(blob, kind="raw")
 
     t_con = t_connect(t_db)
     t_init_db(t_con, _repo_root() / "termite_fieldpack" / "sql" / "schema.sql")
@@ -134,15 +143,12 @@ def _build_minimal_signed_bundle(
         {"op": "ADD_NODE", "id": "doc:1", "type": "Document", "attrs": {"name": "x"}},
         {"op": "ADD_EDGE", "src": "task:1", "dst": "doc:1", "rel": "REFERENCES", "attrs": {}},
     ]
-    import hashlib
-
+    rows = []
     for op in ops:
         op_json = json.dumps(op, separators=(",", ":"), sort_keys=True)
-        op_hash = hashlib.sha256(op_json.encode("utf-8")).hexdigest()
-        t_con.execute(
-            "INSERT INTO kg_ops(ts_utc, op_json, op_hash) VALUES(?,?,?)",
-            (utc_now_iso(), op_json, op_hash),
-        )
+        op_hash = hash_str(op_json)
+        rows.append((utc_now_iso(), op_json, op_hash))
+    insert_kg_ops(t_con, rows)
     t_con.commit()
 
     inp = SealInputs(
@@ -156,6 +162,7 @@ def _build_minimal_signed_bundle(
         deterministic_zip=True,
         policy_hash=pol.canonical_hash(),
         allowlist_hash=canonical_hash_dict(allow_for_hash),
+        digest_algo=digest_algo,
     )
     bundle_path = build_bundle(inp, label="a4")
     return bundle_path, policy_path, allowlist_path
@@ -260,3 +267,63 @@ def test_a4_strict_verification_fails_when_cdx_required_but_missing(tmp_path: Pa
     vr = verify_bundle(bad_bundle, policy=policy, allowlist=allowlist)
     assert vr.ok is False
     assert vr.reason == "missing_cyclonedx_sbom"
+
+
+def test_a4_blake2b_manifest_digests_verify(tmp_path: Path):
+    from termite.verify import verify_bundle
+    from termite.policy import load_policy
+    from termite.tools import load_allowlist
+
+    bundle_path, policy_path, allowlist_path = _build_minimal_signed_bundle(
+        tmp_path,
+        require_dsse=True,
+        require_cdx=True,
+        digest_algo="blake2b-256",
+    )
+    policy = load_policy(policy_path)
+    allowlist = load_allowlist(allowlist_path)
+
+    with zipfile.ZipFile(bundle_path) as z:
+        manifest = json.loads(z.read("manifest.json"))
+    assert manifest["digest_algo"] == "blake2b-256"
+
+    vr = verify_bundle(bundle_path, policy=policy, allowlist=allowlist)
+    assert vr.ok is True, vr.reason
+
+    bad_bundle = tmp_path / "bad_delta.zip"
+    _write_zip_variant(bundle_path, bad_bundle, replace={"kg_delta.jsonl": b"{}\n"})
+    vr = verify_bundle(bad_bundle, policy=policy, allowlist=allowlist)
+    assert vr.ok is False
+    assert vr.reason == "hash_mismatch:kg_delta.jsonl"
+
+
+def test_a4_compressed_cas_blobs_are_stored_not_deflated(tmp_path: Path):
+    import gzip
+
+    from termite.cas import sha256_bytes
+    from termite.verify import verify_bundle
+    from termite.policy import load_policy
+    from termite.tools import load_allowlist
+
+    gz_blob = gzip.compress(b"field notes " * 512, mtime=0)
+    text_blob = b"plain text " * 512
+    bundle_path, policy_path, allowlist_path = _build_minimal_signed_bundle(
+        tmp_path,
+        require_dsse=True,
+        require_cdx=True,
+        raw_blobs=(gz_blob, text_blob),
+    )
+
+    with zipfile.ZipFile(bundle_path) as z:
+        kinds = {i.filename: i.compress_type for i in z.infolist()}
+        assert z.read(f"cas/raw/{sha256_bytes(gz_blob)}") == gz_blob
+    assert kinds[f"cas/raw/{sha256_bytes(gz_blob)}"] == zipfile.ZIP_STORED
+    assert kinds[f"cas/raw/{sha256_bytes(text_blob)}"] == zipfile.ZIP_DEFLATED
+    assert kinds["manifest.json"] == zipfile.ZIP_DEFLATED
+
+    vr = verify_bundle(
+        bundle_path,
+        policy=load_policy(policy_path),
+        allowlist=load_allowlist(allowlist_path),
+    )
+    assert vr.ok is True, vr.reason
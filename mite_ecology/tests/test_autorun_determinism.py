@@ -5,7 +5,6 @@ from pathlib import Path
 from mite_ecology.db import connect, init_db
 from mite_ecology.kg import KnowledgeGraph
 from mite_ecology.auto import autorun, AutoRunConfig
-from mite_ecology.hashutil import canonical_json, sha256_str
 
 
 def _init_kg(tmp_path: Path) -> KnowledgeGraph:
@@ -33,8 +32,6 @@ def test_autorun_is_deterministic(tmp_path: Path):
     r1 = autorun(kg1, context_node_id="task:1", cfg=cfg)
     r2 = autorun(kg2, context_node_id="task:1", cfg=cfg)
 
-    h1 = sha256_str(canonical_json(r1))
-    h2 = sha256_str(canonical_json(r2))
-
-    assert h1 == h2
+    # Structural equality short-circuits at the first difference and builds no JSON.
+    assert r1 == r2
     assert r1["final_best"] == r2["final_best"]
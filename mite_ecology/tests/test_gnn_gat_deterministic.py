@@ -1,4 +1,4 @@
-import tempfile, json
+import tempfile
 from pathlib import Path
 from mite_ecology.db import connect, init_db
 from mite_ecology.kg import KnowledgeGraph
@@ -21,9 +21,9 @@ def test_deterministic_embeddings_and_attention():
             nodes, edges = kg.neighborhood("a", hops=1)
             emb1 = message_passing_embeddings(nodes, edges, feature_dim=16, hops=2)
             emb2 = message_passing_embeddings(nodes, edges, feature_dim=16, hops=2)
-            assert json.dumps(emb1, sort_keys=True) == json.dumps(emb2, sort_keys=True)
+            assert emb1 == emb2
             att1 = compute_edge_attention(nodes, edges, emb1, context_node_id="a", alpha=0.2)
             att2 = compute_edge_attention(nodes, edges, emb2, context_node_id="a", alpha=0.2)
-            assert json.dumps(att1, sort_keys=True) == json.dumps(att2, sort_keys=True)
+            assert att1 == att2
         finally:
             con.close()
@@ -89,3 +89,24 @@ def test_event_has_run_context(tmp_path: Path) -> None:
     assert payload.get("run_id")
     assert isinstance(payload.get("trace_id"), str)
     assert payload.get("trace_id")
+
+
+def test_replay_keeps_unicode_line_separators_inside_records(tmp_path: Path) -> None:
+    from mite_ecology.delta import apply_delta_text
+
+    lp = tmp_path / "graph_delta_ledger.jsonl"
+    # canonical_json leaves U+2028 unescaped, so it sits raw inside the ledger line.
+    ops = [json.dumps({"op": "ADD_NODE", "id": "n1", "type": "Thing", "attrs": {"note": "a\u2028b"}})]
+    append_graph_delta_event(lp, source="TEST", ops_lines=ops)
+    assert "\u2028" in lp.read_text(encoding="utf-8")
+
+    ok, n = verify_ledger_chain(lp)
+    assert (ok, n) == (True, 1)
+
+    con = sqlite3.connect(":memory:")
+    con.row_factory = sqlite3.Row
+    init_db(con, _schema_path())
+    kg = KnowledgeGraph(con)
+    applied = sum(apply_delta_text(kg, ops_from_event(rec)) for rec in iter_ledger(lp))
+    assert applied == 1
+    assert kg.nodes()[0].attrs == {"note": "a\u2028b"}
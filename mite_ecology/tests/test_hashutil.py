@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from mite_ecology.hashutil import (
+    canonical_json,
+    edge_key_and_attrs_json,
+    json_loads,
+    sha256_file,
+    stable_edge_key,
+)
+
+
+def test_sha256_file_matches_whole_buffer_digest(tmp_path: Path) -> None:
+    data = bytes(range(256)) * 5000  # spans several small read buffers
+    p = tmp_path / "blob.bin"
+    p.write_bytes(data)
+
+    assert sha256_file(p, bufsize=4096) == hashlib.sha256(data).hexdigest()
+    assert sha256_file(p) == hashlib.sha256(data).hexdigest()
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert sha256_file(empty) == hashlib.sha256(b"").hexdigest()
+
+
+def test_json_loads_matches_stdlib_including_fallback_inputs() -> None:
+    for text in (
+        '{"b":[1,2.5,"x"],"a":null}',
+        "[123456789012345678901234567890]",
+        "[-9223372036854775809]",
+        '["\\ud800"]',
+    ):
+        assert json_loads(text) == json.loads(text)
+        assert json_loads(text.encode("utf-8")) == json.loads(text)
+
+
+def test_edge_key_and_attrs_json_matches_stable_edge_key() -> None:
+    cases = [
+        ("a", "b", "REL", {}),
+        ("n\u00e9", 'q"u\\ote', "line\u2028sep\n", {"w": 1.5, "tags": ["x", None], "z": {"k": True}}),
+        (str.__new__(type("S", (str,), {}), "sub"), "b", "REL", {"x": 1}),  # str subclass path
+    ]
+    for src, dst, etype, attrs in cases:
+        assert edge_key_and_attrs_json(src, dst, etype, attrs) == (
+            stable_edge_key(src, dst, etype, attrs),
+            canonical_json(attrs),
+        )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from mite_ecology.db import init_db
+from mite_ecology.kg import KnowledgeGraph
+
+
+def _kg() -> KnowledgeGraph:
+    con = sqlite3.connect(":memory:")
+    con.row_factory = sqlite3.Row
+    init_db(con, Path(__file__).resolve().parents[1] / "sql" / "schema.sql")
+    return KnowledgeGraph(con)
+
+
+def test_batch_commits_once_and_rolls_back_on_error() -> None:
+    kg = _kg()
+
+    with kg.batch():
+        kg.upsert_node("a", "Thing", {})
+        with kg.batch():
+            kg.upsert_edge("a", "b", "R", {})
+        assert kg.con.in_transaction
+    assert not kg.con.in_transaction
+    assert [n.id for n in kg.nodes()] == ["a"]
+
+    with pytest.raises(RuntimeError):
+        with kg.batch():
+            kg.upsert_node("z", "Thing", {})
+            raise RuntimeError("boom")
+    assert [n.id for n in kg.nodes()] == ["a"]
+    assert len(kg.edges()) == 1
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from mite_ecology.memoga import DRNG, Genome, crossover
+
+
+def test_rand_batch_matches_successive_rand() -> None:
+    a = DRNG("0123456789abcdef")
+    b = DRNG("0123456789abcdef")
+
+    batch = b.rand_batch(64)
+    assert batch.tolist() == [a.rand() for _ in range(64)]
+    # Both generators must be left in the same state.
+    assert a.next_u64() == b.next_u64()
+
+
+def test_crossover_keeps_int_edges_and_is_deterministic() -> None:
+    g1 = Genome("g1", "ctx", ["a", "b"], [5, 1, 3], {"dropout": 0.1, "width": 128}, "t")
+    g2 = Genome("g2", "ctx", ["c"], [], {"dropout": 0.3, "width": 64}, "t")
+
+    c1 = crossover(g1, g2, DRNG("feedface"), max_nodes=8, max_edges=8)
+    c2 = crossover(g1, g2, DRNG("feedface"), max_nodes=8, max_edges=8)
+
+    assert c1.genome_id == c2.genome_id
+    assert c1.edges == sorted(c1.edges)
+    assert all(type(e) is int for e in c1.edges)
+    assert set(c1.edges) <= {1, 3, 5}
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from mite_ecology.registry import load_variants_registry
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_registry_reload_sees_edits_and_isolates_results(tmp_path: Path) -> None:
+    p = tmp_path / "variants.yaml"
+    _write(p, "type: registry_variants/1.0\nversion: '1.0'\nvariants:\n  - variant_id: a\n")
+
+    r1 = load_variants_registry(p)
+    r1.data["variants"][0]["variant_id"] = "mutated"
+
+    # Mutating a previous result must not leak into later loads.
+    r2 = load_variants_registry(p)
+    assert r2.data["variants"][0]["variant_id"] == "a"
+    assert r2.canonical_sha256 == r1.canonical_sha256
+
+    _write(p, "type: registry_variants/1.0\nversion: '1.0'\nvariants:\n  - variant_id: b\n  - variant_id: a\n")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    r3 = load_variants_registry(p)
+    assert [v["variant_id"] for v in r3.data["variants"]] == ["a", "b"]
+    assert r3.canonical_sha256 != r2.canonical_sha256
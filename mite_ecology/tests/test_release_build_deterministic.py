@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 import time
+import zipfile
 
-from mite_ecology.release import build_release, release_zip_sha256
+import pytest
+
+from mite_ecology.release import build_release, release_zip_sha256, verify_release_zip
 
 
 def _write(path: Path, text: str) -> None:
@@ -11,7 +15,7 @@ def _write(path: Path, text: str) -> None:
     path.write_text(text, encoding="utf-8")
 
 
-def test_release_build_is_deterministic(tmp_path: Path) -> None:
+def test_release_build_is_deterministic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     # Minimal valid registries that satisfy the JSON Schemas.
     comps = tmp_path / "components.yaml"
     vars_ = tmp_path / "variants.yaml"
@@ -58,6 +62,9 @@ def test_release_build_is_deterministic(tmp_path: Path) -> None:
     out1 = tmp_path / "out1"
     out2 = tmp_path / "out2"
 
+    # Ensure wall-clock time does not affect the artifact: the builds straddle a
+    # second boundary on a fake clock instead of sleeping.
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
     r1 = build_release(
         out_dir=out1,
         components_path=comps,
@@ -65,8 +72,7 @@ def test_release_build_is_deterministic(tmp_path: Path) -> None:
         remotes_path=rems,
     )
 
-    # Ensure wall-clock time does not affect the artifact.
-    time.sleep(1.1)
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_002.0)
 
     r2 = build_release(
         out_dir=out2,
@@ -80,3 +86,31 @@ def test_release_build_is_deterministic(tmp_path: Path) -> None:
 
     # Zip bytes should also be stable.
     assert release_zip_sha256(r1.zip_path) == release_zip_sha256(r2.zip_path)
+
+
+def test_verify_release_zip_canonical_manifest_fast_path_and_strict(tmp_path: Path) -> None:
+    comps = tmp_path / "components.yaml"
+    vars_ = tmp_path / "variants.yaml"
+    rems = tmp_path / "remotes.yaml"
+    _write(comps, "type: registry_components/1.0\nversion: '1.0'\ncomponents:\n  - component_id: c\n")
+    _write(vars_, "type: registry_variants/1.0\nversion: '1.0'\nvariants:\n  - variant_id: v\n")
+    _write(rems, "type: registry_remotes/1.0\nversion: '1.0'\nremotes: []\n")
+
+    r = build_release(out_dir=tmp_path / "out", components_path=comps, variants_path=vars_, remotes_path=rems)
+    rep = verify_release_zip(zip_path=r.zip_path, strict=True)
+    assert rep["manifest_sha256"] == r.manifest_sha256
+
+    # A pretty-printed (non-canonical) manifest still verifies by content, but not in strict mode.
+    src = Path(r.zip_path)
+    alt = tmp_path / "alt" / src.name
+    alt.parent.mkdir()
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(alt, "w") as zout:
+        for name in zin.namelist():
+            data = zin.read(name)
+            if name == "manifest.json":
+                data = json.dumps(json.loads(data), indent=2).encode("utf-8")
+            zout.writestr(name, data)
+
+    assert verify_release_zip(zip_path=alt)["manifest_sha256"] == r.manifest_sha256
+    with pytest.raises(ValueError, match="manifest_not_canonical"):
+        verify_release_zip(zip_path=alt, strict=True)
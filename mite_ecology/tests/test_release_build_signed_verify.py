@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 from pathlib import Path
 
+import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
@@ -35,7 +36,7 @@ def _write_ed25519_keypair(priv_path: Path, pub_path: Path) -> None:
     pub_path.write_bytes(pub_bytes)
 
 
-def test_release_build_signed_is_deterministic_and_verifiable(tmp_path: Path) -> None:
+def test_release_build_signed_is_deterministic_and_verifiable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     comps = tmp_path / "components.yaml"
     vars_ = tmp_path / "variants.yaml"
     rems = tmp_path / "remotes.yaml"
@@ -86,6 +87,8 @@ def test_release_build_signed_is_deterministic_and_verifiable(tmp_path: Path) ->
     out1 = tmp_path / "out1"
     out2 = tmp_path / "out2"
 
+    # Fake clock two seconds apart rather than sleeping across a second boundary.
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
     r1 = build_release(
         out_dir=out1,
         components_path=comps,
@@ -97,7 +100,7 @@ def test_release_build_signed_is_deterministic_and_verifiable(tmp_path: Path) ->
         signing_public_key_path=pub,
     )
 
-    time.sleep(1.1)
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_002.0)
 
     r2 = build_release(
         out_dir=out2,
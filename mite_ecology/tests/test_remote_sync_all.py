@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from mite_ecology.remote_sync import sync_all_remotes
+
+
+def test_sync_all_remotes_parallel_keeps_input_order_and_filters(tmp_path: Path) -> None:
+    remotes = [
+        {"remote_id": f"r{i}", "tuf_base": "https://example.invalid/tuf"} for i in range(6)
+    ]
+    remotes.insert(2, {"remote_id": "off", "tuf_base": "x", "enabled": False})
+    remotes.insert(4, "not-a-dict")  # type: ignore[arg-type]
+
+    serial = sync_all_remotes(remotes, cache_root=tmp_path, max_workers=1)
+    parallel = sync_all_remotes(remotes, cache_root=tmp_path, max_workers=4)
+
+    assert [r.remote_id for r in parallel] == [f"r{i}" for i in range(6)]
+    assert [(r.remote_id, r.ok, r.error) for r in parallel] == [(r.remote_id, r.ok, r.error) for r in serial]
+    assert all(r.error == "missing_trust_root_path" for r in parallel)
+
+    only = sync_all_remotes(remotes, cache_root=tmp_path, only_remote_id="r3", max_workers=4)
+    assert [r.remote_id for r in only] == ["r3"]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from mite_ecology.db import init_db
+from mite_ecology.hashutil import sha256_str
+from mite_ecology.replay import verify_hash_chains
+
+
+def _mem_db() -> sqlite3.Connection:
+    con = sqlite3.connect(":memory:")
+    con.row_factory = sqlite3.Row
+    init_db(con, Path(__file__).resolve().parents[1] / "sql" / "schema.sql")
+    return con
+
+
+def _append_delta(con: sqlite3.Connection, delta_hash: str, prev: str | None) -> None:
+    chain = sha256_str((prev or "") + "|" + delta_hash)
+    con.execute(
+        "INSERT INTO kg_deltas(ts_utc, source, delta_kind, delta_payload, prev_hash, delta_hash, chain_hash) "
+        "VALUES('t', 's', 'k', '', ?, ?, ?)",
+        (prev, delta_hash, chain),
+    )
+
+
+def test_verify_hash_chains_accepts_valid_and_flags_broken_links() -> None:
+    con = _mem_db()
+    prev = None
+    for i in range(5):
+        dh = sha256_str(f"delta-{i}")
+        _append_delta(con, dh, prev)
+        prev = dh
+
+    assert verify_hash_chains(con) == {"kg_deltas_chain_ok": True, "ingested_chain_ok": True}
+
+    con.execute("UPDATE kg_deltas SET chain_hash='00' WHERE id=3")
+    assert verify_hash_chains(con)["kg_deltas_chain_ok"] is False
+
+    con.execute("UPDATE kg_deltas SET chain_hash=? WHERE id=3", (sha256_str(sha256_str("delta-1") + "|" + sha256_str("delta-2")),))
+    assert verify_hash_chains(con)["kg_deltas_chain_ok"] is True
+
+    con.execute("UPDATE kg_deltas SET prev_hash='bogus' WHERE id=4")
+    assert verify_hash_chains(con)["kg_deltas_chain_ok"] is False
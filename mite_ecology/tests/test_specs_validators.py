@@ -26,3 +26,121 @@ def test_valid_tubespec():
     obj = {"tubespec": "1.0", "runtime": {"python": ">=3.10", "os": "linux"}, "deps": ["PyYAML>=6.0"]}
     issues = validate_tubespec(obj)
     assert issues == []
+
+
+def test_validator_for_caches_by_schema_content():
+    from mite_ecology.specs import validator_for
+
+    a = validator_for({"type": "object", "required": ["x"]})
+    b = validator_for({"required": ["x"], "type": "object"})
+    assert a is b
+    assert not a.is_valid({})
+
+
+def test_fail_fast_reports_single_issue():
+    obj = {"studspec": "2.0", "kind": "nope"}
+    full = validate_studspec(obj)
+    first = validate_studspec(obj, fail_fast=True)
+    assert len(full) > 1
+    assert len(first) == 1
+
+
+def test_validate_spec_file_sees_edits(tmp_path):
+    import json
+    import os
+
+    from mite_ecology.specs import validate_spec_file
+
+    p = tmp_path / "tube.json"
+    p.write_text(json.dumps({"tubespec": "1.0", "runtime": {"python": ">=3.10"}, "deps": []}), encoding="utf-8")
+    assert validate_spec_file("tube", p) == (True, [])
+    assert validate_spec_file("tubespec", p) == (True, [])
+
+    p.write_text(json.dumps({"tubespec": "1.0"}), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    ok, issues = validate_spec_file("tube", p)
+    assert not ok and issues
+
+
+def test_builtin_schemas_are_read_only():
+    import pytest
+
+    from mite_ecology.specs import STUDSPEC_V1_SCHEMA
+
+    assert STUDSPEC_V1_SCHEMA["properties"]["io"]["properties"]["inputs"]["items"]["$ref"] == "#/$defs/ioPort"
+    with pytest.raises(TypeError):
+        STUDSPEC_V1_SCHEMA["type"] = "array"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        STUDSPEC_V1_SCHEMA["properties"]["kind"]["enum"] = []  # type: ignore[index]
+
+
+def test_validate_many_and_files(tmp_path):
+    import json
+
+    from mite_ecology.specs import validate_many, validate_spec_files
+
+    good = {"tubespec": "1.0", "runtime": {"python": ">=3.10"}, "deps": []}
+    bad = {"tubespec": "1.0"}
+    res = validate_many("tubespec", [good, bad, good])
+    assert res[0] == [] and res[1] and res[2] == []
+    assert res[1] == validate_tubespec(bad)
+
+    paths = []
+    for i, obj in enumerate([good, bad, good]):
+        p = tmp_path / f"t{i}.json"
+        p.write_text(json.dumps(obj), encoding="utf-8")
+        paths.append(p)
+    oks = [ok for ok, _ in validate_spec_files("tube", paths)]
+    assert oks == [True, False, True]
+
+
+def test_spec_issue_is_slotted():
+    from dataclasses import asdict
+
+    from mite_ecology.specs import SpecIssue
+
+    issue = validate_studspec({"studspec": "1.0"})[0]
+    assert not hasattr(issue, "__dict__")
+    assert set(asdict(issue)) == {"path", "message", "validator", "severity"}
+    assert hash(SpecIssue("/", "m")) == hash(SpecIssue("/", "m"))
+
+
+def test_fast_path_gated_to_keywords_both_validators_share():
+    from mite_ecology.specs import _fast_path_safe
+
+    base = {"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "object"}
+    assert _fast_path_safe({**base, "properties": {"a": {"type": "integer"}}, "required": ["a"]})
+    # fastjsonschema (drafts 4/6/7) ignores these; it would accept {"a": 1} here.
+    assert not _fast_path_safe({**base, "dependentRequired": {"a": ["b"]}})
+    assert not _fast_path_safe({**base, "properties": {"t": {"prefixItems": [{"type": "string"}]}}})
+    assert not _fast_path_safe({**base, "unevaluatedProperties": False})
+    assert not _fast_path_safe({**base, "$defs": {"x": {"$ref": "#/$defs/y", "minLength": 2}}})
+
+
+def test_fast_path_agrees_with_jsonschema_on_builtin_specs():
+    import copy
+
+    from mite_ecology.specs import _is_valid, _validators
+
+    stud = {
+        "studspec": "1.0",
+        "memite_id": "X::Y::V1",
+        "kind": "backend",
+        "io": {"inputs": [{"name": "t", "schema": "ldna://text/plain@1.0"}], "outputs": []},
+        "constraints": {"determinism": "bounded", "max_ram_mb": 512, "max_latency_ms": 1000},
+    }
+    tube = {"tubespec": "1.0", "runtime": {"python": ">=3.10", "os": "linux"}, "deps": ["PyYAML>=6.0"]}
+    for kind, good in (("stud", stud), ("tube", tube)):
+        fast, v = _validators(kind)
+        docs = [good]
+        for key in good:
+            drop = copy.deepcopy(good)
+            del drop[key]
+            docs.append(drop)
+            for bad in (None, 0, -1, "", "x", [], {}, [1], {"a": 1}):
+                mut = copy.deepcopy(good)
+                mut[key] = bad
+                docs.append(mut)
+        for doc in docs:
+            assert _is_valid(fast, v, doc) == v.is_valid(doc), doc
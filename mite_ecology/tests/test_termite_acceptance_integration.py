@@ -26,11 +26,11 @@ def test_termite_to_ecology_acceptance_path(tmp_path: Path):
 
     # termite imports
     from termite.cas import CAS
-    from termite.db import connect as t_connect, init_db as t_init_db
+    from termite.db import connect as t_connect, init_db as t_init_db, insert_kg_ops
     from termite.bundle import SealInputs, build_bundle
     from termite.policy import load_policy, canonical_hash_dict
     from termite.tools import load_allowlist
-    from termite.provenance import utc_now_iso
+    from termite.provenance import hash_str, utc_now_iso
     from termite.signing import load_or_create
 
     # mite_ecology imports
@@ -83,7 +83,8 @@ def test_termite_to_ecology_acceptance_path(tmp_path: Path):
 
     pol = load_policy(policy_path)
     allow = load_allowlist(allowlist_path)
-    allow_for_hash = {k: v for k, v in allow.items() if k != "_base_dir"}
+    allow_for_hash = dict(allow)
+    allow_for_hash.pop("_base_dir", None)
 
     # ------------------------
     # Build a minimal termite bundle
@@ -102,17 +103,14 @@ def test_termite_to_ecology_acceptance_path(tmp_path: Path):
         {"op": "ADD_NODE", "id": "doc:1", "type": "Document", "attrs": {"name": "x"}},
         {"op": "ADD_EDGE", "src": "task:1", "dst": "doc:1", "rel": "REFERENCES", "attrs": {}},
     ]
+    # Termite op_hash isn't re-verified by mite_ecology; it's used for internal provenance.
+    # Keep deterministic hashing anyway.
+    rows = []
     for op in ops:
         op_json = json.dumps(op, separators=(",", ":"), sort_keys=True)
-        # Termite op_hash isn't re-verified by mite_ecology; it's used for internal provenance.
-        # Keep deterministic hashing anyway.
-        import hashlib
-
-        op_hash = hashlib.sha256(op_json.encode("utf-8")).hexdigest()
-        t_con.execute(
-            "INSERT INTO kg_ops(ts_utc, op_json, op_hash) VALUES(?,?,?)",
-            (utc_now_iso(), op_json, op_hash),
-        )
+        op_hash = hash_str(op_json)
+        rows.append((utc_now_iso(), op_json, op_hash))
+    insert_kg_ops(t_con, rows)
     t_con.commit()
 
     inp = SealInputs(
@@ -21,7 +21,10 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "fieldgrade_ui.openapi.json"
 
-    out_path.write_text(json.dumps(schema, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Stream to disk; same bytes as json.dumps(...) + "\n" without the whole string in memory.
+    with out_path.open("w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2, sort_keys=True)
+        f.write("\n")
     print(str(out_path))
     return 0
 
@@ -17,7 +17,7 @@ def main() -> int:
     sys.path.insert(0, str(repo))
 
     from mite_ecology.mite_ecology.db import init_db  # noqa: WPS433
-    from mite_ecology.mite_ecology.delta import apply_delta_lines  # noqa: WPS433
+    from mite_ecology.mite_ecology.delta import apply_delta_text  # noqa: WPS433
     from mite_ecology.mite_ecology.graph_delta import iter_ledger, ops_from_event, verify_ledger_chain  # noqa: WPS433
     from mite_ecology.mite_ecology.kg import KnowledgeGraph  # noqa: WPS433
     from mite_ecology.mite_ecology.replay import snapshot_hash  # noqa: WPS433
@@ -47,10 +47,10 @@ def main() -> int:
 
     kg = KnowledgeGraph(mem)
     total_ops = 0
-    for rec in iter_ledger(args.ledger):
-        ops_payload = ops_from_event(rec)
-        lines = [ln for ln in ops_payload.splitlines() if ln.strip()]
-        total_ops += apply_delta_lines(kg, lines)
+    # One transaction for the whole replay instead of a commit per op.
+    with kg.batch():
+        for rec in iter_ledger(args.ledger):
+            total_ops += apply_delta_text(kg, ops_from_event(rec))
 
     rep = {
         "ok": True,
@@ -3,17 +3,21 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 from .cas import CAS
 from .db import connect, export_kg_ops_jsonl, export_provenance_jsonl
-from .provenance import canonical_json, hash_bytes, hash_str, utc_now_iso
+from .provenance import DEFAULT_DIGEST_ALGO, MANIFEST_DIGESTS, canonical_json_bytes, hash_bytes, hash_str, utc_now_iso
 from .sbom import build_cyclonedx_bom
 from .signing import load_or_create
 from .dsse import (
+    envelope_json_bytes,
     keyid_for_pubkey_pem,
     make_intoto_statement,
     sign_dsse,
@@ -22,26 +26,89 @@ from .dsse import (
 # Deterministic ZIP timestamp (1980-01-01 00:00:00) per ZIP epoch
 FIXED_ZIP_DT: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
 
-def _zip_write_bytes(z: zipfile.ZipFile, arcname: str, data: bytes, *, deterministic: bool) -> None:
+_COPY_CHUNK = 1 << 20
+
+@dataclass(frozen=True)
+class BundleEntry:
+    """One bundle member: either in-memory bytes or a file streamed from disk."""
+    arcname: str
+    data: Optional[bytes] = None
+    path: Optional[Path] = None
+
+def _hash_path(p: Path, new_hash: Callable[[], Any] = hashlib.sha256) -> str:
+    """Digest of a file (SHA-256 by default), read in 1 MiB blocks (no whole-file buffer)."""
+    h = new_hash()
+    with p.open("rb") as f:
+        for block in iter(lambda: f.read(_COPY_CHUNK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+# Leading bytes of already-compressed containers. CAS members are named by hash (no
+# suffix), so the content itself decides: these are stored instead of re-deflated.
+_COMPRESSED_MAGIC: Tuple[bytes, ...] = (
+    b"PK\x03\x04",          # zip / jar / whl / docx
+    b"\x1f\x8b",             # gzip
+    b"\x89PNG",              # png
+    b"\xff\xd8\xff",         # jpeg
+    b"\xfd7zXZ\x00",         # xz
+    b"\x28\xb5\x2f\xfd",     # zstd
+    b"BZh",                  # bzip2
+    b"7z\xbc\xaf\x27\x1c",    # 7z
+)
+_MAGIC_PROBE = max(len(m) for m in _COMPRESSED_MAGIC)
+
+# Deflate level for compressible members. Level 1 deflates JSON/JSONL roughly twice as
+# fast as zlib's default 6 for slightly larger output. Stays on stdlib zlib: another
+# deflate backend (isal, zlib-ng) would produce different member bytes per host.
+ZIP_COMPRESSLEVEL = 1
+
+def _zip_info(arcname: str, *, deterministic: bool, compress: bool = True) -> zipfile.ZipInfo:
     zi = zipfile.ZipInfo(arcname)
     if deterministic:
         zi.date_time = FIXED_ZIP_DT
-    zi.compress_type = zipfile.ZIP_DEFLATED
-    z.writestr(zi, data)
+    if compress:
+        zi.compress_type = zipfile.ZIP_DEFLATED
+        # Honoured by both writestr() and open("w"). Public from 3.13; older versions
+        # only have the private slot.
+        if hasattr(zi, "compress_level"):
+            zi.compress_level = ZIP_COMPRESSLEVEL
+        else:
+            zi._compresslevel = ZIP_COMPRESSLEVEL
+    else:
+        zi.compress_type = zipfile.ZIP_STORED
+    return zi
+
+def _zip_write_bytes(z: zipfile.ZipFile, arcname: str, data: bytes, *, deterministic: bool, compress: bool = True) -> None:
+    z.writestr(_zip_info(arcname, deterministic=deterministic, compress=compress), data)
 
 def _zip_write_file(z: zipfile.ZipFile, arcname: str, path: Path, *, deterministic: bool) -> None:
-    data = path.read_bytes()
-    _zip_write_bytes(z, arcname, data, deterministic=deterministic)
+    # Same member bytes as writestr(), but streamed block-by-block.
+    with path.open("rb") as src:
+        compress = not src.read(_MAGIC_PROBE).startswith(_COMPRESSED_MAGIC)
+        src.seek(0)
+        zi = _zip_info(arcname, deterministic=deterministic, compress=compress)
+        # zipfile picks zip64 from the declared size when opening for write (writestr
+        # sets it from len(data)); without it, members over 2 GiB fail at close.
+        zi.file_size = os.fstat(src.fileno()).st_size
+        with z.open(zi, "w") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+def _iter_cas_files(cas_dir: Path) -> Iterator[Tuple[str, Path]]:
+    """(name, path) of regular files in a CAS directory, in name order.
+
+    scandir() hands back the entry type with the listing, so no per-file stat().
+    """
+    with os.scandir(cas_dir) as it:
+        entries = [e for e in it if e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    for e in entries:
+        yield e.name, Path(e.path)
 
 def _calc_bundle_map_hash(files_map: dict) -> str:
     """Hash of the bundle file-map: sha256 over sorted name=hash lines."""
-    h = hashlib.sha256()
-    for name in sorted(files_map.keys()):
-        h.update(name.encode("utf-8"))
-        h.update(b"=")
-        h.update(str(files_map[name]).encode("utf-8"))
-        h.update(b"\n")
-    return h.hexdigest()
+    # One buffer, one digest call: per-line update() calls cost more than the hashing.
+    blob = "".join(f"{name}={files_map[name]}\n" for name in sorted(files_map)).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
 
 @dataclass
 class SealInputs:
@@ -63,6 +130,8 @@ class SealInputs:
     include_sbom: bool = True
     include_kg_delta: bool = True
     deterministic_zip: bool = True
+    # manifest "files" digest; see provenance.MANIFEST_DIGESTS
+    digest_algo: str = DEFAULT_DIGEST_ALGO
 
     # audit binding
     policy_hash: Optional[str] = None
@@ -91,26 +160,28 @@ def build_bundle_from_parts(
     kg_delta_jsonl: str,
 ) -> Path:
     inp.bundles_out.mkdir(parents=True, exist_ok=True)
-    bundle_name = f"termite_bundle_{label}_{utc_now_iso().replace(':','').replace('-','')}.zip"
+    # One timestamp for the bundle name and every created_utc (manifest, attestation, DSSE).
+    now = utc_now_iso()
+    bundle_name = f"termite_bundle_{label}_{now.replace(':','').replace('-','')}.zip"
     out_path = (inp.bundles_out / bundle_name).resolve()
 
-    files: List[Tuple[str, bytes]] = []
+    # arcname -> entry; only the names are sorted at write time.
+    files: Dict[str, BundleEntry] = {}
+
+    def add(e: BundleEntry) -> None:
+        files[e.arcname] = e
 
     # -------------------------
-    # Include CAS content
+    # Include CAS content (path-backed: streamed at hash and zip time)
     # -------------------------
-    if inp.include_raw and inp.cas.blobs_dir.exists():
-        for p in sorted(inp.cas.blobs_dir.glob("*")):
-            if p.is_file():
-                files.append((f"cas/raw/{p.name}", p.read_bytes()))
-    if inp.include_extract and inp.cas.extracts_dir.exists():
-        for p in sorted(inp.cas.extracts_dir.glob("*")):
-            if p.is_file():
-                files.append((f"cas/extract/{p.name}", p.read_bytes()))
-    if inp.include_aux and inp.cas.aux_dir.exists():
-        for p in sorted(inp.cas.aux_dir.glob("*")):
-            if p.is_file():
-                files.append((f"cas/aux/{p.name}", p.read_bytes()))
+    for enabled, cas_dir, prefix in (
+        (inp.include_raw, inp.cas.blobs_dir, "cas/raw"),
+        (inp.include_extract, inp.cas.extracts_dir, "cas/extract"),
+        (inp.include_aux, inp.cas.aux_dir, "cas/aux"),
+    ):
+        if enabled and cas_dir.exists():
+            for name, p in _iter_cas_files(cas_dir):
+                add(BundleEntry(f"{prefix}/{name}", path=p))
 
     # -------------------------
     # Include provenance + kg_delta (JSONL)
@@ -119,13 +190,13 @@ def build_bundle_from_parts(
     if inp.include_provenance:
         prov_bytes = provenance_jsonl.encode("utf-8")
         provenance_hash = hash_bytes(prov_bytes)
-        files.append(("provenance.jsonl", prov_bytes + (b"\n" if not prov_bytes.endswith(b"\n") and prov_bytes else b"")))
+        add(BundleEntry("provenance.jsonl", prov_bytes + (b"\n" if not prov_bytes.endswith(b"\n") and prov_bytes else b"")))
 
     kg_delta_hash: Optional[str] = None
     if inp.include_kg_delta:
         delta_bytes = kg_delta_jsonl.encode("utf-8")
         kg_delta_hash = hash_bytes(delta_bytes)
-        files.append(("kg_delta.jsonl", delta_bytes + (b"\n" if not delta_bytes.endswith(b"\n") and delta_bytes else b"")))
+        add(BundleEntry("kg_delta.jsonl", delta_bytes + (b"\n" if not delta_bytes.endswith(b"\n") and delta_bytes else b"")))
 
     # -------------------------
     # Include SBOM (CycloneDX JSON) + DSSE attestation
@@ -133,18 +204,35 @@ def build_bundle_from_parts(
     sbom_hash: Optional[str] = None
     if inp.include_sbom:
         sbom_obj = build_cyclonedx_bom()
-        sbom_bytes = (canonical_json(sbom_obj) + "\n").encode("utf-8")
+        sbom_bytes = canonical_json_bytes(sbom_obj)
         sbom_hash = hash_bytes(sbom_bytes)
-        files.append(("sbom/bom.cdx.json", sbom_bytes))
+        add(BundleEntry("sbom/bom.cdx.json", sbom_bytes))
 
     # -------------------------
     # Build manifest (hashes of included files)
     # -------------------------
-    files_map = {name: hash_bytes(data) for (name, data) in files}
+    new_hash = MANIFEST_DIGESTS.get(inp.digest_algo)
+    if new_hash is None:
+        raise ValueError(f"unsupported digest_algo: {inp.digest_algo}")
+    # hashlib drops the GIL while digesting, so CAS files hash in parallel threads.
+    paths = [e.path for e in files.values() if e.data is None]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+            path_digests = iter(list(ex.map(lambda p: _hash_path(p, new_hash), paths)))
+    else:
+        path_digests = iter([_hash_path(p, new_hash) for p in paths])
+    files_map = {}
+    for e in files.values():
+        if e.data is None:
+            files_map[e.arcname] = next(path_digests)
+        else:
+            h = new_hash()
+            h.update(e.data)
+            files_map[e.arcname] = h.hexdigest()
     manifest_obj = {
         "manifest_version": "2",
         "toolchain_id": inp.toolchain_id,
-        "created_utc": utc_now_iso(),
+        "created_utc": now,
         "files": files_map,
         "bundle_map_hash": _calc_bundle_map_hash(files_map),
         "policy_hash": inp.policy_hash,
@@ -153,9 +241,20 @@ def build_bundle_from_parts(
         "provenance_hash": provenance_hash,
         "kg_delta_hash": kg_delta_hash,
     }
-    manifest_bytes = (canonical_json(manifest_obj) + "\n").encode("utf-8")
+    if inp.digest_algo != DEFAULT_DIGEST_ALGO:
+        # only written when non-default, so SHA-256 manifests keep their exact bytes
+        manifest_obj["digest_algo"] = inp.digest_algo
+    manifest_bytes = canonical_json_bytes(manifest_obj)
     manifest_hash = hash_bytes(manifest_bytes)
-    files.append(("manifest.json", manifest_bytes))
+    add(BundleEntry("manifest.json", manifest_bytes))
+
+    # Signing material: one PEM parse + one public-key read, shared by the legacy
+    # signature and both DSSE envelopes.
+    kp = None
+    kid = None
+    if inp.signing_enabled:
+        kp = load_or_create(inp.signing_priv, inp.signing_pub)
+        kid = keyid_for_pubkey_pem(inp.signing_pub.read_bytes())
 
     # -------------------------
     # Attestation (legacy JSON + signature)
@@ -171,26 +270,21 @@ def build_bundle_from_parts(
         "sbom_hash": sbom_hash,
         "provenance_hash": provenance_hash,
         "kg_delta_hash": kg_delta_hash,
-        "created_utc": utc_now_iso(),
+        "created_utc": now,
         "algo": "ed25519",
         "signing_schema": "ed25519_canonical_attestation_v2",
     }
-    att_bytes = (canonical_json(attestation) + "\n").encode("utf-8")
-    files.append(("attestation.json", att_bytes))
+    att_bytes = canonical_json_bytes(attestation)
+    add(BundleEntry("attestation.json", att_bytes))
 
-    if inp.signing_enabled:
-        kp = load_or_create(inp.signing_priv, inp.signing_pub)
+    if kp is not None:
         sig = kp.sign(att_bytes)
-        files.append(("attestation.sig", base64.b64encode(sig) + b"\n"))
+        add(BundleEntry("attestation.sig", base64.b64encode(sig) + b"\n"))
 
     # -------------------------
     # DSSE attestations (strict mode consumers rely on these)
     # -------------------------
-    if inp.signing_enabled:
-        kp = load_or_create(inp.signing_priv, inp.signing_pub)
-        pub_pem = inp.signing_pub.read_bytes()
-        kid = keyid_for_pubkey_pem(pub_pem)
-
+    if kp is not None:
         # SBOM DSSE (bind the CycloneDX JSON)
         if inp.include_sbom and sbom_hash:
             sbom_stmt = make_intoto_statement(
@@ -198,7 +292,7 @@ def build_bundle_from_parts(
                 predicate_type="https://mite.ecology/termite/sbom/v1",
                 predicate={
                     "toolchain_id": inp.toolchain_id,
-                    "created_utc": utc_now_iso(),
+                    "created_utc": now,
                     "sbom_format": "CycloneDX",
                     "sbom_spec_version": str(sbom_obj.get("specVersion") or ""),
                 },
@@ -209,7 +303,7 @@ def build_bundle_from_parts(
                 signer=kp.private_key,
                 keyid=kid,
             )
-            files.append(("sbom/bom.dsse.json", (canonical_json(sbom_env) + "\n").encode("utf-8")))
+            add(BundleEntry("sbom/bom.dsse.json", envelope_json_bytes(sbom_env) + b"\n"))
 
         # Build DSSE (bind manifest + governance hashes)
         build_stmt = make_intoto_statement(
@@ -218,7 +312,7 @@ def build_bundle_from_parts(
             predicate={
                 "toolchain_id": inp.toolchain_id,
                 "label": label,
-                "created_utc": utc_now_iso(),
+                "created_utc": now,
                 "bundle_map_hash": manifest_obj["bundle_map_hash"],
                 "policy_hash": inp.policy_hash,
                 "allowlist_hash": inp.allowlist_hash,
@@ -233,13 +327,17 @@ def build_bundle_from_parts(
             signer=kp.private_key,
             keyid=kid,
         )
-        files.append(("attestation.dsse.json", (canonical_json(build_env) + "\n").encode("utf-8")))
+        add(BundleEntry("attestation.dsse.json", envelope_json_bytes(build_env) + b"\n"))
 
     # -------------------------
     # Write zip deterministically (sorted by arcname)
     # -------------------------
     with zipfile.ZipFile(out_path, "w") as z:
-        for name, data in sorted(files, key=lambda x: x[0]):
-            _zip_write_bytes(z, name, data, deterministic=inp.deterministic_zip)
+        for name in sorted(files):
+            e = files[name]
+            if e.data is not None:
+                _zip_write_bytes(z, e.arcname, e.data, deterministic=inp.deterministic_zip)
+            else:
+                _zip_write_file(z, e.arcname, e.path, deterministic=inp.deterministic_zip)
 
     return out_path
@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chunk:
     index: int
     start: int
@@ -18,16 +18,25 @@ def chunk_text(text: str, chunk_chars: int, overlap_chars: int, min_chunk_chars:
         min_chunk_chars = 1
 
     n = len(text)
+    step = chunk_chars - overlap_chars
+    if step <= 0:
+        if n > chunk_chars:
+            # a second window would never advance past the first
+            raise ValueError("overlap_chars must be < chunk_chars when text exceeds chunk_chars")
+        step = chunk_chars  # the whole text fits in the first window
     chunks: List[Chunk] = []
-    i = 0
+    append = chunks.append
     idx = 0
-    while i < n:
-        end = min(n, i + chunk_chars)
+    # Windows start every (chunk_chars - overlap_chars); one slice per window, and
+    # str.strip() hands back that same slice when there is no edge whitespace.
+    for i in range(0, n, step):
+        end = i + chunk_chars
+        if end > n:
+            end = n
         piece = text[i:end].strip()
         if len(piece) >= min_chunk_chars:
-            chunks.append(Chunk(index=idx, start=i, end=end, text=piece))
+            append(Chunk(idx, i, end, piece))
             idx += 1
         if end == n:
             break
-        i = max(0, end - overlap_chars)
     return chunks
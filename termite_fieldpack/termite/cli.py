@@ -79,6 +79,8 @@ def cmd_seal(args) -> int:
     pol = load_policy(cfg.policy_path)
     allow = yaml.safe_load(cfg.allowlist_path.read_text(encoding="utf-8")) or {}
     allow["_base_dir"] = str(cfg.allowlist_path.resolve().parent)
+    allow_for_hash = dict(allow)
+    allow_for_hash.pop("_base_dir", None)
 
     inp = SealInputs(
         toolchain_id=cfg.toolchain_id,
@@ -96,7 +98,7 @@ def cmd_seal(args) -> int:
         include_kg_delta=cfg.include_kg_delta,
         deterministic_zip=cfg.deterministic_zip,
         policy_hash=pol.canonical_hash(),
-        allowlist_hash=canonical_hash_dict({k:v for k,v in allow.items() if k != "_base_dir"}),
+        allowlist_hash=canonical_hash_dict(allow_for_hash),
     )
     out = build_bundle(inp, label=args.label)
     print(str(out))
@@ -107,9 +109,9 @@ def cmd_validate_spec(args) -> int:
     p = Path(args.file).resolve()
     obj = json.loads(p.read_text(encoding="utf-8"))
     if args.kind.lower() in ("stud", "studspec"):
-        issues = [i.__dict__ for i in validate_studspec(obj)]
+        issues = [asdict(i) for i in validate_studspec(obj)]
     elif args.kind.lower() in ("tube", "tubespec"):
-        issues = [i.__dict__ for i in validate_tubespec(obj)]
+        issues = [asdict(i) for i in validate_tubespec(obj)]
     else:
         raise SystemExit("unknown spec kind")
     out = {"ok": len(issues) == 0, "kind": args.kind, "file": str(p), "issues": issues}
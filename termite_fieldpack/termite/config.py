@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import yaml
 
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 def _expand(p: str) -> str:
     return os.path.expandvars(os.path.expanduser(p))
 
 
+def _resolve(p: str) -> Path:
+    # Resolved on every access, not memoized: the result depends on env vars, the cwd
+    # and symlinks, any of which can change under a long-running process.
+    return Path(_expand(p)).resolve()
+
+
 @dataclass(frozen=True)
 class LLMLaunchConfig:
     enabled: bool = False
@@ -49,14 +63,22 @@ class LLMConfig:
 
 @dataclass(frozen=True)
 class TermiteConfig:
+    """Typed view over the parsed termite.yaml mapping (`raw`, treated as read-only).
+
+    Scalar settings and the structured `llm` view are cached_property: computed on
+    first access and stored in the instance __dict__ (which bypasses the frozen
+    __setattr__). Path properties stay live because they expand env vars and resolve
+    against the current directory (and follow symlinks) on every access;
+    llm_launch_command/env still return fresh copies.
+    """
     raw: Dict[str, Any]
 
     # -------------------------
     # Structured LLM config (backward compatible)
     # -------------------------
-    @property
+    @cached_property
     def llm(self) -> LLMConfig:
-        llm_raw = dict(self.raw.get("llm", {}) or {})
+        llm_raw = self.raw.get("llm") or {}
 
         provider = str(llm_raw.get("provider") or "endpoint_only")
         model = str(llm_raw.get("model") or "")
@@ -75,14 +97,14 @@ class TermiteConfig:
             base_url = f"http://{host}:{port}"
 
         offline_loopback_only = bool(llm_raw.get("offline_loopback_only", True))
-        ping_raw = dict(llm_raw.get("ping", {}) or {})
+        ping_raw = llm_raw.get("ping") or {}
         ping_path = str(ping_raw.get("path") or "/v1/models")
         try:
             ping_timeout_s = float(ping_raw.get("timeout_s") or 3.0)
         except Exception:
             ping_timeout_s = 3.0
 
-        launch_raw = dict(llm_raw.get("launch", {}) or {})
+        launch_raw = llm_raw.get("launch") or {}
         enabled = bool(launch_raw.get("enabled", False))
 
         command: Union[str, List[str], None]
@@ -143,160 +165,160 @@ class TermiteConfig:
     # -------------------------
     @property
     def runtime_root(self) -> Path:
-        return Path(_expand(self.raw["termite"]["runtime_root"])).resolve()
+        return _resolve(self.raw["termite"]["runtime_root"])
 
     @property
     def cas_root(self) -> Path:
-        return Path(_expand(self.raw["termite"]["cas_root"])).resolve()
+        return _resolve(self.raw["termite"]["cas_root"])
 
     @property
     def db_path(self) -> Path:
-        return Path(_expand(self.raw["termite"]["db_path"])).resolve()
+        return _resolve(self.raw["termite"]["db_path"])
 
     @property
     def bundles_out(self) -> Path:
-        return Path(_expand(self.raw["termite"]["bundles_out"])).resolve()
+        return _resolve(self.raw["termite"]["bundles_out"])
 
     # Paths to governance policy + allowlist (used for sealing audit fields)
     @property
     def policy_path(self) -> Path:
         p = self.raw.get("termite", {}).get("policy_path", "./config/meap_v1.yaml")
-        return Path(_expand(str(p))).resolve()
+        return _resolve(str(p))
 
     @property
     def allowlist_path(self) -> Path:
         p = self.raw.get("termite", {}).get("allowlist_path", "./config/tool_allowlist.yaml")
-        return Path(_expand(str(p))).resolve()
+        return _resolve(str(p))
 
     # -------------------------
     # Runtime controls
     # -------------------------
-    @property
+    @cached_property
     def offline_mode(self) -> bool:
         return bool(self.raw["termite"].get("offline_mode", True))
 
-    @property
+    @cached_property
     def network_policy(self) -> str:
         return str(self.raw["termite"].get("network_policy", "deny_by_default"))
 
     # -------------------------
     # Toolchain identity + signing
     # -------------------------
-    @property
+    @cached_property
     def toolchain_id(self) -> str:
         return str(self.raw["toolchain"]["toolchain_id"])
 
-    @property
+    @cached_property
     def signing_enabled(self) -> bool:
         return bool(self.raw.get("toolchain", {}).get("signing", {}).get("enabled", True))
 
     @property
     def signing_private_key_path(self) -> Path:
-        return Path(_expand(self.raw["toolchain"]["signing"]["private_key_path"])).resolve()
+        return _resolve(self.raw["toolchain"]["signing"]["private_key_path"])
 
     @property
     def signing_public_key_path(self) -> Path:
-        return Path(_expand(self.raw["toolchain"]["signing"]["public_key_path"])).resolve()
+        return _resolve(self.raw["toolchain"]["signing"]["public_key_path"])
 
     # -------------------------
     # Ingest settings
     # -------------------------
-    @property
+    @cached_property
     def max_bytes(self) -> int:
         return int(self.raw.get("ingest", {}).get("max_bytes", 25_000_000))
 
-    @property
+    @cached_property
     def extract_text(self) -> bool:
         return bool(self.raw.get("ingest", {}).get("extract_text", True))
 
-    @property
+    @cached_property
     def chunk_chars(self) -> int:
         return int(self.raw.get("ingest", {}).get("chunking", {}).get("chunk_chars", 2000))
 
-    @property
+    @cached_property
     def overlap_chars(self) -> int:
         return int(self.raw.get("ingest", {}).get("chunking", {}).get("overlap_chars", 200))
 
-    @property
+    @cached_property
     def min_chunk_chars(self) -> int:
         return int(self.raw.get("ingest", {}).get("chunking", {}).get("min_chunk_chars", 300))
 
     # -------------------------
     # Seal/export settings
     # -------------------------
-    @property
+    @cached_property
     def include_raw(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_raw_blobs", True))
 
-    @property
+    @cached_property
     def include_extract(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_extracted_blobs", True))
 
-    @property
+    @cached_property
     def include_aux(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_aux", True))
 
-    @property
+    @cached_property
     def include_provenance(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_provenance", True))
 
-    @property
+    @cached_property
     def include_sbom(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_sbom", True))
 
-    @property
+    @cached_property
     def include_kg_delta(self) -> bool:
         return bool(self.raw.get("seal", {}).get("include_kg_delta", True))
 
-    @property
+    @cached_property
     def deterministic_zip(self) -> bool:
         return bool(self.raw.get("seal", {}).get("deterministic_zip", True))
 
     # -------------------------
     # LLM settings (offline endpoint + optional launcher)
     # -------------------------
-    @property
+    @cached_property
     def llm_provider(self) -> str:
         return self.llm.provider
 
-    @property
+    @cached_property
     def llm_endpoint_base_url(self) -> str:
         # Keep legacy name for compatibility (endpoint_base_url).
         return str((self.raw.get("llm", {}) or {}).get("endpoint_base_url") or "")
 
-    @property
+    @cached_property
     def llm_base_url(self) -> str:
         return self.llm.base_url
 
-    @property
+    @cached_property
     def llm_host(self) -> str:
         return self.llm.host
 
-    @property
+    @cached_property
     def llm_port(self) -> int:
         return int(self.llm.port)
 
-    @property
+    @cached_property
     def llm_model_path(self) -> str:
         return str(self.llm.model_path or "")
 
-    @property
+    @cached_property
     def llm_model(self) -> str:
         return self.llm.model
 
-    @property
+    @cached_property
     def llm_offline_loopback_only(self) -> bool:
         return bool(self.llm.offline_loopback_only)
 
-    @property
+    @cached_property
     def llm_ping_path(self) -> str:
         return self.llm.ping_path
 
-    @property
+    @cached_property
     def llm_ping_timeout_s(self) -> int:
         return int(self.llm.ping_timeout_s)
 
-    @property
+    @cached_property
     def llm_launch_enabled(self) -> bool:
         return bool(self.llm.launch.enabled)
 
@@ -308,17 +330,17 @@ class TermiteConfig:
     @property
     def llm_launch_cwd(self) -> Path:
         cwd = self.llm.launch.cwd or str(self.runtime_root / "llm")
-        return Path(_expand(str(cwd))).resolve()
+        return _resolve(str(cwd))
 
     @property
     def llm_launch_env(self) -> Dict[str, str]:
         return dict(self.llm.launch.env)
 
-    @property
+    @cached_property
     def llm_startup_timeout_s(self) -> int:
         return int(self.llm.launch.startup_timeout_seconds)
 
-    @property
+    @cached_property
     def llm_stop_timeout_s(self) -> int:
         return int(self.llm.launch.kill_timeout_seconds)
 
@@ -326,9 +348,32 @@ class TermiteConfig:
 def default_config_path() -> Path:
     return (Path(__file__).resolve().parents[1] / "config" / "termite.yaml").resolve()
 
+# Loaded configs keyed by resolved path; an entry is reused while the file's
+# (mtime_ns, size) signature is unchanged. TermiteConfig is frozen and its `raw` is
+# only read, so the same instance is handed to every caller.
+_CONFIG_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], TermiteConfig]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 32
+_CONFIG_CACHE_LOCK = threading.Lock()
+
 def load_config(path: str | Path) -> TermiteConfig:
     p = Path(path).resolve()
-    raw = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    key = str(p)
+    st = p.stat()
+    sig = (int(st.st_mtime_ns), int(st.st_size))
+    with _CONFIG_CACHE_LOCK:
+        hit = _CONFIG_CACHE.get(key)
+        if hit is not None and hit[0] == sig:
+            _CONFIG_CACHE.move_to_end(key)
+            return hit[1]
+
+    # bytes straight to the loader: libyaml does its own UTF-8 decoding
+    raw = yaml.load(p.read_bytes(), Loader=_SafeLoader) or {}
     if "termite" not in raw:
         raise ValueError("invalid_config: missing top-level 'termite' key")
-    return TermiteConfig(raw)
+    cfg = TermiteConfig(raw)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = (sig, cfg)
+        _CONFIG_CACHE.move_to_end(key)
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+    return cfg
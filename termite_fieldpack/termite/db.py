@@ -1,25 +1,37 @@
 from __future__ import annotations
 import sqlite3
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 def connect(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     con = sqlite3.connect(str(db_path))
     con.row_factory = sqlite3.Row
+    # WAL + synchronous=NORMAL: commits append to the log instead of fsyncing the main
+    # file each time; still durable across process crashes.
+    con.execute("PRAGMA journal_mode=WAL;")
+    con.execute("PRAGMA synchronous=NORMAL;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    con.execute("PRAGMA cache_size=-65536;")
     return con
 
 def init_db(con: sqlite3.Connection, schema_sql_path: Path) -> None:
     con.executescript(schema_sql_path.read_text(encoding="utf-8"))
     con.commit()
 
+# compile_options describe the linked libsqlite, which is process-wide.
+_HAS_FTS5: Optional[bool] = None
+
 def sqlite_has_fts5(con: sqlite3.Connection) -> bool:
+    global _HAS_FTS5
+    if _HAS_FTS5 is not None:
+        return _HAS_FTS5
     try:
         rows = con.execute("PRAGMA compile_options;").fetchall()
-        opts = {r[0] for r in rows}
-        return any("FTS5" in o for o in opts)
     except Exception:
         return False
+    _HAS_FTS5 = any("FTS5" in r[0] for r in rows)
+    return _HAS_FTS5
 
 def latest_event_hash(con: sqlite3.Connection) -> Optional[str]:
     row = con.execute("SELECT event_hash FROM events ORDER BY id DESC LIMIT 1").fetchone()
@@ -44,9 +56,20 @@ def insert_chunk(con, doc_id: int, chunk_index: int, start_char: int, end_char:
         (doc_id, chunk_index, start_char, end_char, text, text_sha256, created_utc),
     )
 
+def insert_chunks(con, rows: Iterable[Tuple[int, int, int, int, str, str, str]]):
+    """Bulk insert_chunk: one prepared statement for all (doc_id, chunk_index, start_char, end_char, text, text_sha256, created_utc) rows."""
+    con.executemany(
+        "INSERT INTO chunks(doc_id, chunk_index, start_char, end_char, text, text_sha256, created_utc) VALUES(?,?,?,?,?,?,?)",
+        rows,
+    )
+
 def insert_kg_op(con, ts_utc: str, op_json: str, op_hash: str):
     con.execute("INSERT INTO kg_ops(ts_utc, op_json, op_hash) VALUES(?,?,?)", (ts_utc, op_json, op_hash))
 
+def insert_kg_ops(con, rows: Iterable[Tuple[str, str, str]]):
+    """Bulk insert_kg_op: one prepared statement for all (ts_utc, op_json, op_hash) rows."""
+    con.executemany("INSERT INTO kg_ops(ts_utc, op_json, op_hash) VALUES(?,?,?)", rows)
+
 def export_kg_ops_jsonl(con) -> str:
     rows = con.execute("SELECT op_json FROM kg_ops ORDER BY id ASC").fetchall()
     if not rows:
@@ -57,14 +80,15 @@ def export_provenance_jsonl(con) -> str:
     rows = con.execute("SELECT ts_utc, event_type, payload_json, prev_hash, event_hash FROM events ORDER BY id ASC").fetchall()
     if not rows:
         return ""
+    from .provenance import json_str as q  # provenance imports this module at load time
+    # payload_json is already canonical and is spliced in verbatim; re-dumping a dict
+    # would reorder keys and change the exported bytes.
     return "\n".join([
-        '{"ts_utc":' + json_escape(r["ts_utc"]) + ',"event_type":' + json_escape(r["event_type"]) +
-        ',"payload":' + (r["payload_json"] or "{}") +
-        ',"prev_hash":' + (json_escape(r["prev_hash"]) if r["prev_hash"] is not None else "null") +
-        ',"event_hash":' + json_escape(r["event_hash"]) + '}'
+        f'{{"ts_utc":{q(r[0])},"event_type":{q(r[1])},"payload":{r[2] or "{}"},'
+        f'"prev_hash":{q(r[3]) if r[3] is not None else "null"},"event_hash":{q(r[4])}}}'
         for r in rows
     ]) + "\n"
 
 def json_escape(s: str) -> str:
-    import json
-    return json.dumps(str(s), ensure_ascii=False)
+    from .provenance import json_str
+    return json_str(str(s))
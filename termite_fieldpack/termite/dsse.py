@@ -14,16 +14,19 @@ import hashlib
 import json
 from typing import Any, Dict, Optional
 
+from .provenance import json_str
+
 
 DSSE_V1 = b"DSSEv1"
 
 
 def _b64e(b: bytes) -> str:
-    return base64.b64encode(b).decode("utf-8")
+    return base64.b64encode(b).decode("ascii")
 
 
 def _b64d(s: str) -> bytes:
-    return base64.b64decode(s.encode("utf-8"))
+    # b64decode takes ASCII str directly; anything else was never valid base64.
+    return base64.b64decode(s)
 
 
 def pae(payload_type: str, payload: bytes) -> bytes:
@@ -34,19 +37,8 @@ def pae(payload_type: str, payload: bytes) -> bytes:
     where LEN are ASCII decimal lengths.
     """
     pt = payload_type.encode("utf-8")
-    return b"".join(
-        [
-            DSSE_V1,
-            b" ",
-            str(len(pt)).encode("utf-8"),
-            b" ",
-            pt,
-            b" ",
-            str(len(payload)).encode("utf-8"),
-            b" ",
-            payload,
-        ]
-    )
+    # One small formatted header, then a single copy of the (possibly large) payload.
+    return b"%s %d %s %d " % (DSSE_V1, len(pt), pt, len(payload)) + payload
 
 
 def keyid_for_pubkey_pem(pub_pem: bytes) -> str:
@@ -68,6 +60,34 @@ def envelope(
     }
 
 
+_ENVELOPE_KEYS = frozenset(("payload", "payloadType", "signatures"))
+_SIGNATURE_KEYS = frozenset(("keyid", "sig"))
+
+
+def envelope_json_bytes(env: Dict[str, Any]) -> bytes:
+    """Canonical JSON bytes (sorted keys, compact, ensure_ascii=False) of a DSSE envelope.
+
+    Envelopes shaped like `envelope()` output are written field-by-field, skipping the
+    generic sort_keys walk; anything else goes through json.dumps with the same settings.
+    """
+    sigs = env.get("signatures")
+    if (
+        env.keys() == _ENVELOPE_KEYS
+        and isinstance(env["payload"], str)
+        and isinstance(env["payloadType"], str)
+        and isinstance(sigs, list)
+        and all(
+            isinstance(s, dict) and s.keys() == _SIGNATURE_KEYS and isinstance(s["keyid"], str) and isinstance(s["sig"], str)
+            for s in sigs
+        )
+    ):
+        sig_json = ",".join('{"keyid":' + json_str(s["keyid"]) + ',"sig":' + json_str(s["sig"]) + "}" for s in sigs)
+        text = '{"payload":' + json_str(env["payload"]) + ',"payloadType":' + json_str(env["payloadType"]) + ',"signatures":[' + sig_json + "]}"
+    else:
+        text = json.dumps(env, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
 def sign_dsse(
     *,
     payload_type: str,
@@ -3,15 +3,18 @@ import mimetypes
 from pathlib import Path
 from typing import Optional, Tuple
 
+_TEXT_SUFFIXES = frozenset({".md",".txt",".log",".json",".yaml",".yml",".py",".js",".ts",".html",".css"})
+
 def sniff_mime(path: Path) -> str:
     mt, _ = mimetypes.guess_type(str(path))
     return mt or "application/octet-stream"
 
-def extract_text_best_effort(path: Path, raw_bytes: bytes) -> Tuple[Optional[str], str]:
-    mime = sniff_mime(path)
+def extract_text_best_effort(path: Path, raw_bytes: bytes, mime: Optional[str] = None) -> Tuple[Optional[str], str]:
+    if mime is None:
+        mime = sniff_mime(path)
     suffix = path.suffix.lower()
 
-    if mime.startswith("text/") or suffix in {".md",".txt",".log",".json",".yaml",".yml",".py",".js",".ts",".html",".css"}:
+    if mime.startswith("text/") or suffix in _TEXT_SUFFIXES:
         try:
             return raw_bytes.decode("utf-8"), "utf8"
         except UnicodeDecodeError:
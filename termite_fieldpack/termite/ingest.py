@@ -1,19 +1,55 @@
 from __future__ import annotations
-import hashlib, json
+import functools, hashlib, json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 from .cas import CAS, sha256_bytes
 from .chunking import chunk_text
 from .extract import extract_text_best_effort, sniff_mime
 from .provenance import Provenance, utc_now_iso, canonical_json, hash_str
-from .db import insert_blob, insert_doc, insert_chunk, insert_kg_op
+from .db import insert_blob, insert_doc, insert_chunks, insert_kg_ops
 
 def sha256_text(s: str) -> str:
     h = hashlib.sha256()
     h.update(s.encode("utf-8"))
     return h.hexdigest()
 
+_READ_CHUNK = 1 << 20
+_BINARY_PROBE = 8192
+
+def _read_and_hash(path: Path, max_bytes: int) -> Tuple[bytearray, str]:
+    """Read `path` into one buffer, hashing each 1 MiB window while it is still in cache.
+
+    Oversized files are rejected from their stat size, before any bytes are read.
+    """
+    size = path.stat().st_size
+    if size > max_bytes:
+        raise ValueError(f"File exceeds max_bytes: {size} > {max_bytes}")
+    buf = bytearray(size)
+    mv = memoryview(buf)
+    h = hashlib.sha256()
+    n = 0
+    with path.open("rb") as f:
+        while n < size:
+            got = f.readinto(mv[n:n + _READ_CHUNK])
+            if not got:
+                break
+            h.update(mv[n:n + got])
+            n += got
+        # The file may have changed size since stat(); trust what was actually read.
+        tail = f.read(max_bytes - n + 1)
+    mv.release()
+    if n < size:
+        del buf[n:]
+    if tail:
+        buf += tail
+        h.update(tail)
+    if len(buf) > max_bytes:
+        raise ValueError(f"File exceeds max_bytes: {len(buf)} > {max_bytes}")
+    return buf, h.hexdigest()
+
 @dataclass
 class IngestResult:
     doc_id: int
@@ -22,10 +58,23 @@ class IngestResult:
     mime: str
     chunks: int
 
-def ingest_path(
-    con,
+@dataclass
+class _Prepared:
+    """Everything about one file that needs no DB: hashes, CAS placement and chunk rows.
+
+    Picklable, so ingest_paths can build these in worker processes.
+    """
+    path: str
+    mime: str
+    raw_sha256: str
+    raw_size: int
+    extract_sha256: Optional[str]
+    extract_size: int
+    extract_strategy: str
+    chunks: List[Tuple[int, int, int, str, str]]  # (index, start, end, text, text_sha256)
+
+def _prepare(
     cas: CAS,
-    prov: Provenance,
     path: Path,
     *,
     max_bytes: int,
@@ -33,80 +82,178 @@ def ingest_path(
     chunk_chars: int,
     overlap_chars: int,
     min_chunk_chars: int,
-) -> IngestResult:
+) -> _Prepared:
     path = path.resolve()
-    raw = path.read_bytes()
-    if len(raw) > max_bytes:
-        raise ValueError(f"File exceeds max_bytes: {len(raw)} > {max_bytes}")
+    raw, raw_sha = _read_and_hash(path, max_bytes)
 
     mime = sniff_mime(path)
-    created = utc_now_iso()
 
-    raw_sha = sha256_bytes(raw)
+    # CAS paths are content-addressed: workers racing on one blob write identical bytes.
     cas.put(raw, kind="raw", sha256=raw_sha)
-    insert_blob(con, raw_sha, "raw", len(raw), created, str(path))
 
     extract_sha = None
+    extract_size = 0
     extracted_text = None
     strategy = "none"
     if extract_text:
-        extracted_text, strategy = extract_text_best_effort(path, raw)
+        extracted_text, strategy = extract_text_best_effort(path, raw, mime)
         if extracted_text:
             ext_bytes = extracted_text.encode("utf-8")
             extract_sha = sha256_bytes(ext_bytes)
+            extract_size = len(ext_bytes)
             cas.put(ext_bytes, kind="extract", sha256=extract_sha)
-            insert_blob(con, extract_sha, "extract", len(ext_bytes), created, str(path))
-
-    doc_id = insert_doc(con, str(path), mime, raw_sha, extract_sha, created)
 
     text_for_chunking = extracted_text if (extracted_text and extract_text) else None
     if text_for_chunking is None:
-        try:
-            text_for_chunking = raw.decode("utf-8")
-        except Exception:
+        if raw.find(b"\x00", 0, _BINARY_PROBE) != -1:
+            # NUL in the head: treat as binary rather than decoding a large unused string.
             text_for_chunking = ""
+        else:
+            try:
+                text_for_chunking = raw.decode("utf-8")
+            except Exception:
+                text_for_chunking = ""
 
-    chunks = chunk_text(text_for_chunking, chunk_chars, overlap_chars, min_chunk_chars)
-    for c in chunks:
-        insert_chunk(con, doc_id, c.index, c.start, c.end, c.text, sha256_text(c.text), created)
-    con.commit()
-
-    prov.append_event(
-        con,
-        "INGEST",
-        {
-            "path": str(path),
-            "mime": mime,
-            "raw_blob_sha256": raw_sha,
-            "extract_blob_sha256": extract_sha,
-            "extract_strategy": strategy,
-            "chunks": len(chunks),
-            "doc_id": doc_id,
-        },
+    # Each chunk's digest feeds both its DB row and its KG op; hash the text once.
+    chunks = [
+        (c.index, c.start, c.end, c.text, sha256_text(c.text))
+        for c in chunk_text(text_for_chunking, chunk_chars, overlap_chars, min_chunk_chars)
+    ]
+    return _Prepared(
+        path=str(path),
+        mime=mime,
+        raw_sha256=raw_sha,
+        raw_size=len(raw),
+        extract_sha256=extract_sha,
+        extract_size=extract_size,
+        extract_strategy=strategy,
+        chunks=chunks,
     )
 
+def _chunk_op_jsons(raw_sha: str, chunks: Iterable[Tuple[int, int, int, str, str]]) -> Iterator[str]:
+    """canonical_json of each chunk's ADD_NODE and HAS_CHUNK ops, formatted directly.
+
+    Keys are written in sorted order. Every value is a hex digest or an int, so no
+    escaping is needed. The per-document fragments are built once, and only
+    index/start/end/digest are spliced per chunk.
+    """
+    ch_prefix = f"chunk:{raw_sha}:"
+    node_head = f'{{"attrs":{{"doc":"doc:{raw_sha}","end":'
+    edge_tail = f'","op":"ADD_EDGE","src":"doc:{raw_sha}","type":"HAS_CHUNK"}}'
+    for index, start, end, _text, text_sha in chunks:
+        yield (
+            f'{node_head}{end},"index":{index},"start":{start},"text_sha256":"{text_sha}"}},'
+            f'"id":"{ch_prefix}{index}","op":"ADD_NODE","type":"Chunk"}}'
+        )
+        yield f'{{"attrs":{{}},"dst":"{ch_prefix}{index}{edge_tail}'
+
+def _write(con, prov: Provenance, prep: _Prepared) -> IngestResult:
+    path = prep.path
+    mime = prep.mime
+    raw_sha = prep.raw_sha256
+    extract_sha = prep.extract_sha256
+    chunks = prep.chunks
+    created = utc_now_iso()
+
+    insert_blob(con, raw_sha, "raw", prep.raw_size, created, path)
+    if extract_sha:
+        insert_blob(con, extract_sha, "extract", prep.extract_size, created, path)
+
+    doc_id = insert_doc(con, path, mime, raw_sha, extract_sha, created)
+
+    insert_chunks(con, [
+        (doc_id, index, start, end, text, text_sha, created)
+        for index, start, end, text, text_sha in chunks
+    ])
+
     # Emit KG ops (delta-friendly JSON lines)
     doc_node = f"doc:{raw_sha}"
     raw_node = f"blob:raw:{raw_sha}"
     ops = []
-    ops.append({"op":"ADD_NODE","id":doc_node,"type":"Document","attrs":{"path":str(path),"mime":mime,"doc_id":doc_id,"created_utc":created}})
-    ops.append({"op":"ADD_NODE","id":raw_node,"type":"Blob","attrs":{"kind":"raw","sha256":raw_sha,"size_bytes":len(raw)}})
+    ops.append({"op":"ADD_NODE","id":doc_node,"type":"Document","attrs":{"path":path,"mime":mime,"doc_id":doc_id,"created_utc":created}})
+    ops.append({"op":"ADD_NODE","id":raw_node,"type":"Blob","attrs":{"kind":"raw","sha256":raw_sha,"size_bytes":prep.raw_size}})
     ops.append({"op":"ADD_EDGE","src":doc_node,"dst":raw_node,"type":"HAS_BLOB","attrs":{"kind":"raw"}})
 
     if extract_sha:
         ext_node = f"blob:extract:{extract_sha}"
-        ops.append({"op":"ADD_NODE","id":ext_node,"type":"Blob","attrs":{"kind":"extract","sha256":extract_sha,"size_bytes":len(ext_bytes)}})
+        ops.append({"op":"ADD_NODE","id":ext_node,"type":"Blob","attrs":{"kind":"extract","sha256":extract_sha,"size_bytes":prep.extract_size}})
         ops.append({"op":"ADD_EDGE","src":doc_node,"dst":ext_node,"type":"HAS_BLOB","attrs":{"kind":"extract"}})
 
-    for c in chunks[: min(200, len(chunks))]:
-        ch_id = f"chunk:{raw_sha}:{c.index}"
-        ops.append({"op":"ADD_NODE","id":ch_id,"type":"Chunk","attrs":{"doc":doc_node,"index":c.index,"start":c.start,"end":c.end,"text_sha256":sha256_text(c.text)}})
-        ops.append({"op":"ADD_EDGE","src":doc_node,"dst":ch_id,"type":"HAS_CHUNK","attrs":{}})
-
+    rows = []
     for op in ops:
         j = canonical_json(op)
-        insert_kg_op(con, created, j, hash_str(j))
+        rows.append((created, j, hash_str(j)))
+    for j in _chunk_op_jsons(raw_sha, islice(chunks, 200)):
+        rows.append((created, j, hash_str(j)))
+    insert_kg_ops(con, rows)
 
-    con.commit()
+    # Blobs, doc, chunks and KG ops are all still pending; the INGEST event's commit
+    # closes them out as one transaction.
+    prov.append_event(
+        con,
+        "INGEST",
+        {
+            "path": path,
+            "mime": mime,
+            "raw_blob_sha256": raw_sha,
+            "extract_blob_sha256": extract_sha,
+            "extract_strategy": prep.extract_strategy,
+            "chunks": len(chunks),
+            "doc_id": doc_id,
+        },
+    )
 
     return IngestResult(doc_id=doc_id, raw_sha256=raw_sha, extract_sha256=extract_sha, mime=mime, chunks=len(chunks))
+
+def ingest_path(
+    con,
+    cas: CAS,
+    prov: Provenance,
+    path: Path,
+    *,
+    max_bytes: int,
+    extract_text: bool,
+    chunk_chars: int,
+    overlap_chars: int,
+    min_chunk_chars: int,
+) -> IngestResult:
+    prep = _prepare(
+        cas, path,
+        max_bytes=max_bytes,
+        extract_text=extract_text,
+        chunk_chars=chunk_chars,
+        overlap_chars=overlap_chars,
+        min_chunk_chars=min_chunk_chars,
+    )
+    return _write(con, prov, prep)
+
+def ingest_paths(
+    con,
+    cas: CAS,
+    prov: Provenance,
+    paths: Sequence[Path],
+    *,
+    max_bytes: int,
+    extract_text: bool,
+    chunk_chars: int,
+    overlap_chars: int,
+    min_chunk_chars: int,
+    max_workers: Optional[int] = None,
+) -> List[IngestResult]:
+    """Ingest many files: read/extract/hash/chunk in worker processes, write from here.
+
+    Results come back in `paths` order and each file is committed as it arrives, so the
+    DB (and the provenance chain) ends up exactly as with sequential ingest_path calls.
+    """
+    prepare = functools.partial(
+        _prepare, cas,
+        max_bytes=max_bytes,
+        extract_text=extract_text,
+        chunk_chars=chunk_chars,
+        overlap_chars=overlap_chars,
+        min_chunk_chars=min_chunk_chars,
+    )
+    if len(paths) <= 1 or max_workers == 1:
+        return [_write(con, prov, prepare(p)) for p in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return [_write(con, prov, prep) for prep in ex.map(prepare, paths)]
@@ -2,8 +2,30 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
+import threading
 from typing import Any, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept per host; concurrent callers (llm_chat.chat_many) cap their threads
+# here, since urllib3 discards connections returned beyond this.
+HTTP_POOL_MAXSIZE = 16
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def http_session() -> requests.Session:
+    """Process-wide pooled session for LLM endpoint calls (keep-alive across prompts)."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                _SESSION = s
+    return _SESSION
 
 @dataclass
 class LLMEndpoint:
@@ -21,7 +43,7 @@ class LLMEndpoint:
             "temperature": temperature,
             "messages": [{"role":"user","content": prompt}],
         }
-        r = requests.post(url, headers=headers, data=json.dumps(payload))
+        r = http_session().post(url, headers=headers, data=json.dumps(payload))
         r.raise_for_status()
         obj = r.json()
         return obj["choices"][0]["message"]["content"]
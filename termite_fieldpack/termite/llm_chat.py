@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
-import requests
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .cas import CAS
-from .provenance import canonical_json, hash_str, utc_now_iso
+from .provenance import Provenance, canonical_json, canonical_json_bytes, hash_str, utc_now_iso
 from .config import TermiteConfig
+from .db import connect
+from .llm import HTTP_POOL_MAXSIZE, http_session
 from .llm_runtime import resolve_active_endpoint
 
 def _hash_chain(prev_hash: Optional[str], payload: str) -> str:
@@ -19,17 +20,8 @@ def _latest_call_hash(con) -> Optional[str]:
     row = con.execute("SELECT call_hash FROM llm_calls ORDER BY id DESC LIMIT 1").fetchone()
     return None if row is None else str(row["call_hash"])
 
-def chat(
-    cfg: TermiteConfig,
-    prompt: str,
-    *,
-    temperature: Optional[float] = None,
-    max_tokens: Optional[int] = None,
-    store: bool = True,
-) -> Dict[str, Any]:
-    """Call OpenAI-compatible LLM endpoint configured in termite.yaml (or active endpoint state).
-    Strictly audited when store=True.
-    """
+def _target(cfg: TermiteConfig) -> Tuple[Dict[str, Any], str, str, str]:
+    """(llm settings, base_url, model, endpoint_id), preferring a running local endpoint."""
     llm = (cfg.raw.get('llm') or {})
 
     # Prefer the active runtime endpoint if Termite started a local server and it is ready.
@@ -47,21 +39,17 @@ def chat(
         base_url = str(llm.get('endpoint_base_url') or llm.get('base_url') or 'http://127.0.0.1:8000').rstrip("/")
         model = str(llm.get('model') or 'qwen2.5-coder-0.5b-instruct')
         endpoint_id = ''
-    temp = float(float(llm.get('temperature', 0.0)) if temperature is None else temperature)
-    mtok = int(int(llm.get('max_tokens', 512)) if max_tokens is None else max_tokens)
+    return llm, base_url, model, endpoint_id
 
-    payload = {
-        "model": model,
-        "temperature": temp,
-        "max_tokens": mtok,
-        "messages": [{"role": "user", "content": prompt}],
-    }
+def _headers(llm: Dict[str, Any]) -> Dict[str, str]:
     headers = {"Content-Type": "application/json"}
     api_key = os.environ.get(str(llm.get('api_key_env','OPENAI_API_KEY')), '')
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
+    return headers
 
-    r = requests.post(f"{base_url}/v1/chat/completions", headers=headers, data=canonical_json(payload), timeout=int(llm.get('timeout_s', 30)))
+def _post(base_url: str, headers: Dict[str, str], payload: Dict[str, Any], timeout: int) -> Tuple[Dict[str, Any], str]:
+    r = http_session().post(f"{base_url}/v1/chat/completions", headers=headers, data=canonical_json(payload), timeout=timeout)
     r.raise_for_status()
     data = r.json()
 
@@ -71,52 +59,150 @@ def chat(
         content = data["choices"][0]["message"]["content"]
     except Exception:
         content = json.dumps(data, sort_keys=True)
+    return data, content
 
-    if not store:
-        return {"endpoint_base_url": base_url, "model": model, "endpoint_id": endpoint_id, "temperature": temp, "response": data, "content": content}
-
-    # store request/response in CAS aux + db
+def _store_calls(
+    cfg: TermiteConfig,
+    base_url: str,
+    model: str,
+    endpoint_id: str,
+    temp: float,
+    calls: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+) -> List[Tuple[str, str]]:
+    """Audit (prompt, request payload, response) triples, in order, into CAS aux + db.
+
+    The llm_calls hash chain is computed in Python and inserted with one executemany.
+    The first LLM_CHAT provenance event's commit covers those rows.
+    Returns (prompt_hash, call_hash) per call.
+    """
     cas = CAS(cfg.cas_root); cas.init()
-    con = cfg.db_con()
-    ts = utc_now_iso()
-
-    prompt_hash = hash_str(prompt)
-    req_sha = cas.put_aux((canonical_json(payload) + "\n").encode("utf-8"))
-    resp_bytes = (canonical_json(data) + "\n").encode("utf-8")
-    resp_sha = cas.put_aux(resp_bytes)
-    resp_hash = hash_str(resp_bytes.decode("utf-8"))
-
-    prev = _latest_call_hash(con)
-    chain_payload = canonical_json({
-        "ts_utc": ts,
-        "endpoint_base_url": base_url,
-        "model": model,
-        "endpoint_id": endpoint_id or None,
-        "temperature": temp,
-        "prompt_hash": prompt_hash,
-        "request_aux_sha256": req_sha,
-        "response_aux_sha256": resp_sha,
-        "response_hash": resp_hash,
-        "prev_hash": prev,
-    })
-    call_hash = _hash_chain(prev, chain_payload)
-
-    con.execute(
-        "INSERT INTO llm_calls(ts_utc,endpoint_base_url,model,temperature,prompt_hash,request_aux_sha256,response_aux_sha256,response_hash,prev_hash,call_hash) VALUES(?,?,?,?,?,?,?,?,?,?)",
-        (ts, base_url, model, temp, prompt_hash, req_sha, resp_sha, resp_hash, prev, call_hash),
-    )
-    # provenance event
-    from .provenance import Provenance
-    prov = Provenance(cfg.toolchain_id)
-    prov.emit(con, "LLM_CHAT", {
-        "endpoint_base_url": base_url,
+    con = connect(cfg.db_path)
+    try:
+        prev = _latest_call_hash(con)
+        rows = []
+        events = []
+        out = []
+        for prompt, payload, data in calls:
+            ts = utc_now_iso()
+            prompt_hash = hash_str(prompt)
+            req_sha = cas.put_aux(canonical_json_bytes(payload))
+            resp_bytes = canonical_json_bytes(data)
+            resp_sha = cas.put_aux(resp_bytes)
+            resp_hash = hash_str(resp_bytes.decode("utf-8"))
+
+            chain_payload = canonical_json({
+                "ts_utc": ts,
+                "endpoint_base_url": base_url,
+                "model": model,
+                "endpoint_id": endpoint_id or None,
+                "temperature": temp,
+                "prompt_hash": prompt_hash,
+                "request_aux_sha256": req_sha,
+                "response_aux_sha256": resp_sha,
+                "response_hash": resp_hash,
+                "prev_hash": prev,
+            })
+            call_hash = _hash_chain(prev, chain_payload)
+            rows.append((ts, base_url, model, temp, prompt_hash, req_sha, resp_sha, resp_hash, prev, call_hash))
+            events.append({
+                "endpoint_base_url": base_url,
+                "model": model,
+                "endpoint_id": endpoint_id or None,
+                "temperature": temp,
+                "prompt_hash": prompt_hash,
+                "request_aux_sha256": req_sha,
+                "response_aux_sha256": resp_sha,
+                "call_hash": call_hash,
+            })
+            out.append((prompt_hash, call_hash))
+            prev = call_hash
+
+        con.executemany(
+            "INSERT INTO llm_calls(ts_utc,endpoint_base_url,model,temperature,prompt_hash,request_aux_sha256,response_aux_sha256,response_hash,prev_hash,call_hash) VALUES(?,?,?,?,?,?,?,?,?,?)",
+            rows,
+        )
+        prov = Provenance(cfg.toolchain_id)
+        for ev in events:
+            prov.append_event(con, "LLM_CHAT", ev)
+        con.commit()
+    finally:
+        con.close()
+    return out
+
+def chat(
+    cfg: TermiteConfig,
+    prompt: str,
+    *,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    store: bool = True,
+) -> Dict[str, Any]:
+    """Call OpenAI-compatible LLM endpoint configured in termite.yaml (or active endpoint state).
+    Strictly audited when store=True.
+    """
+    llm, base_url, model, endpoint_id = _target(cfg)
+    temp = float(float(llm.get('temperature', 0.0)) if temperature is None else temperature)
+    mtok = int(int(llm.get('max_tokens', 512)) if max_tokens is None else max_tokens)
+
+    payload = {
         "model": model,
-        "endpoint_id": endpoint_id or None,
         "temperature": temp,
-        "prompt_hash": prompt_hash,
-        "request_aux_sha256": req_sha,
-        "response_aux_sha256": resp_sha,
-        "call_hash": call_hash,
-    })
-    con.commit()
+        "max_tokens": mtok,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    data, content = _post(base_url, _headers(llm), payload, int(llm.get('timeout_s', 30)))
+
+    if not store:
+        return {"endpoint_base_url": base_url, "model": model, "endpoint_id": endpoint_id, "temperature": temp, "response": data, "content": content}
+
+    [(prompt_hash, call_hash)] = _store_calls(cfg, base_url, model, endpoint_id, temp, [(prompt, payload, data)])
     return {"endpoint_base_url": base_url, "model": model, "endpoint_id": endpoint_id, "temperature": temp, "prompt_hash": prompt_hash, "call_hash": call_hash, "content": content, "response": data}
+
+def chat_many(
+    cfg: TermiteConfig,
+    prompts: Sequence[str],
+    *,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    store: bool = True,
+    max_workers: int = HTTP_POOL_MAXSIZE,
+) -> List[Dict[str, Any]]:
+    """chat() for many prompts, sent concurrently so a batching server can decode them together.
+
+    Results (and, when store=True, the audited llm_calls chain) follow `prompts` order.
+    If any request fails the error is raised and nothing is stored.
+    """
+    if not prompts:
+        return []
+    llm, base_url, model, endpoint_id = _target(cfg)
+    temp = float(float(llm.get('temperature', 0.0)) if temperature is None else temperature)
+    mtok = int(int(llm.get('max_tokens', 512)) if max_tokens is None else max_tokens)
+    headers = _headers(llm)
+    timeout = int(llm.get('timeout_s', 30))
+
+    payloads = [
+        {
+            "model": model,
+            "temperature": temp,
+            "max_tokens": mtok,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        for prompt in prompts
+    ]
+    # More threads than pooled connections would just reconnect for the overflow.
+    workers = max(1, min(len(payloads), max_workers, HTTP_POOL_MAXSIZE))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        responses = list(ex.map(lambda p: _post(base_url, headers, p, timeout), payloads))
+
+    base = {"endpoint_base_url": base_url, "model": model, "endpoint_id": endpoint_id, "temperature": temp}
+    if not store:
+        return [dict(base, response=data, content=content) for data, content in responses]
+
+    hashes = _store_calls(
+        cfg, base_url, model, endpoint_id, temp,
+        [(prompt, payload, data) for prompt, payload, (data, _content) in zip(prompts, payloads, responses)],
+    )
+    return [
+        dict(base, prompt_hash=prompt_hash, call_hash=call_hash, content=content, response=data)
+        for (prompt_hash, call_hash), (data, content) in zip(hashes, responses)
+    ]
@@ -10,10 +10,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import requests
-
 from .config import TermiteConfig
 from .db import connect
+from .llm import http_session
 from .provenance import Provenance, utc_now_iso, hash_str
 
 
@@ -330,7 +329,7 @@ def ping(cfg: TermiteConfig) -> Tuple[bool, str]:
     st = read_status(cfg)
     url = st.base_url.rstrip("/") + _ping_path(cfg)
     try:
-        r = requests.get(url, timeout=_ping_timeout(cfg))
+        r = http_session().get(url, timeout=_ping_timeout(cfg))
         if r.status_code >= 200 and r.status_code < 300:
             return True, f"OK {r.status_code} {url}"
         return False, f"BAD {r.status_code} {url}"
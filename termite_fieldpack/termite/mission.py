@@ -65,7 +65,8 @@ def run_mission(mission_yaml: Path, *, config_path: Optional[Path] = None) -> Di
             allow_path = Path(step.get("allowlist") or cfg.allowlist_path)
             pol = load_policy(pol_path)
             allow = load_allowlist(allow_path)
-            allow_for_hash = {k: v for k, v in allow.items() if k != "_base_dir"}
+            allow_for_hash = dict(allow)
+            allow_for_hash.pop("_base_dir", None)
             inp = SealInputs(
                 toolchain_id=cfg.toolchain_id,
                 cas=cas,
@@ -2,17 +2,33 @@ from __future__ import annotations
 import hashlib, json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from .db import latest_event_hash
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+# json.dumps() with non-default options builds a fresh JSONEncoder on every call; the
+# KG op and event loops call this per small dict, so keep one configured encoder.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 def canonical_json(obj: Any) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CANONICAL_ENCODER.encode(obj)
+
+# canonical_json(s) for a str, minus the encoder dispatch; for splicing str fields into
+# hand-built canonical JSON.
+json_str = json.encoder.encode_basestring
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """canonical_json(obj) + newline as UTF-8, without building the concatenated str first."""
+    return canonical_json(obj).encode("utf-8") + b"\n"
+
+# Cloning an initialised hasher is a state memcpy; cheaper than a fresh
+# hashlib.sha256() (algorithm lookup + init) for the many short op/event hashes.
+_SHA256 = hashlib.sha256()
 
 def hash_event(prev_hash: Optional[str], event_type: str, payload: Dict[str, Any]) -> str:
-    h = hashlib.sha256()
+    h = _SHA256.copy()
     h.update((prev_hash or "").encode("utf-8"))
     h.update(b"|")
     h.update(event_type.encode("utf-8"))
@@ -21,10 +37,22 @@ def hash_event(prev_hash: Optional[str], event_type: str, payload: Dict[str, Any
     return h.hexdigest()
 
 def hash_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+    h = _SHA256.copy()
+    h.update(data)
+    return h.hexdigest()
 
 def hash_str(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    return hash_bytes(s.encode("utf-8"))
+
+# Digests allowed for manifest "files" entries, keyed by the manifest's "digest_algo"
+# (absent == "sha256"). SHA-256 stays the default: DSSE/in-toto subjects use it, and on
+# CPUs with SHA extensions OpenSSL's SHA-256 outruns BLAKE2b. "blake2b-256" is an opt-in
+# for hosts without them.
+DEFAULT_DIGEST_ALGO = "sha256"
+MANIFEST_DIGESTS: Dict[str, Callable[[], Any]] = {
+    "sha256": _SHA256.copy,
+    "blake2b-256": lambda: hashlib.blake2b(digest_size=32),
+}
 
 @dataclass
 class Provenance:
@@ -13,15 +13,21 @@ Why CycloneDX?
 We keep this generator small so Termite can run in constrained environments.
 """
 
+import functools
+import os
 import platform
+import sys
 from importlib import metadata
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from .provenance import utc_now_iso
 
 
-def _installed_distributions() -> List[Dict[str, str]]:
-    dists: List[Dict[str, str]] = []
+@functools.lru_cache(maxsize=8)
+def _scan_distributions(search_key: Tuple[Tuple[str, Optional[int]], ...]) -> Tuple[Tuple[str, str], ...]:
+    # Walking every dist-info is the bulk of SBOM cost. `search_key` is only the cache
+    # key; the BOM itself is rebuilt per bundle because its timestamp changes.
+    dists: List[Tuple[str, str]] = []
     for dist in metadata.distributions():
         name = (dist.metadata.get("Name") or "unknown").strip()
         ver = (dist.version or "unknown").strip()
@@ -29,9 +35,27 @@ def _installed_distributions() -> List[Dict[str, str]]:
             name = "unknown"
         if not ver:
             ver = "unknown"
-        dists.append({"name": name, "version": ver})
-    dists.sort(key=lambda x: (x["name"].lower(), x["version"]))
-    return dists
+        dists.append((name, ver))
+    dists.sort(key=lambda x: (x[0].lower(), x[1]))
+    return tuple(dists)
+
+
+def _search_key() -> Tuple[Tuple[str, Optional[int]], ...]:
+    # A directory's mtime changes when a dist-info entry is added or removed, so an
+    # install or upgrade into site-packages invalidates the scan without a sys.path change.
+    key: List[Tuple[str, Optional[int]]] = []
+    for entry in sys.path:
+        try:
+            mtime: Optional[int] = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        key.append((entry, mtime))
+    return tuple(key)
+
+
+def _installed_distributions() -> List[Dict[str, str]]:
+    """Installed distributions on the current sys.path, rescanned when a path entry changes."""
+    return [{"name": n, "version": v} for n, v in _scan_distributions(_search_key())]
 
 
 def build_cyclonedx_bom(*, spec_version: str = "1.5") -> Dict[str, Any]:
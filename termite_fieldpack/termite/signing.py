@@ -37,8 +37,11 @@ def save_keypair(keypair: Ed25519Keypair, priv_path: Path, pub_path: Path) -> No
 def load_private_key(path: Path) -> Ed25519PrivateKey:
     return serialization.load_pem_private_key(path.read_bytes(), password=None)
 
+def public_key_from_pem(pem: bytes) -> Ed25519PublicKey:
+    return serialization.load_pem_public_key(pem)
+
 def load_public_key(path: Path) -> Ed25519PublicKey:
-    return serialization.load_pem_public_key(path.read_bytes())
+    return public_key_from_pem(path.read_bytes())
 
 def load_or_create(priv_path: Path, pub_path: Path) -> Ed25519Keypair:
     if priv_path.exists() and pub_path.exists():
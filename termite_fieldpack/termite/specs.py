@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple
 # validation as part of acceptance.
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecIssue:
     path: str
     message: str
@@ -23,22 +23,29 @@ _KIND_ENUM = {"frontend","backend","db","filler","evaluator","tool","pipeline"}
 _DET_ENUM = {"strict","bounded","best_effort"}
 
 # ldna://<media>/<name>@<semver>
-_LDNA_RE = re.compile(r"^ldna://([a-z0-9+._-]+)/([a-zA-Z0-9._-]+)@([0-9]+\.[0-9]+\.[0-9]+)$")
+# One pass decides all three cases: no match -> not LDNA; prefix-only match
+# (group 1 is None) -> malformed LDNA; full match -> parsed. \Z (not $) so a
+# trailing newline cannot slip through.
+_LDNA_RE = re.compile(r"ldna://(?:([a-z0-9+._-]+)/([a-zA-Z0-9._-]+)@([0-9]+\.[0-9]+\.[0-9]+)\Z)?")
 
 # conservative: block whitespace + path separators in ids
-_SAFE_ID_RE = re.compile(r"^[A-Za-z0-9._:/\-]{3,256}$")
+_SAFE_ID_RE = re.compile(r"[A-Za-z0-9._:/\-]{3,256}\Z")
+
+# Bound matchers for the per-port / per-id hot paths.
+_LDNA_MATCH = _LDNA_RE.match
+_SAFE_ID_MATCH = _SAFE_ID_RE.match
 
 
 def parse_ldna_uri(s: str) -> Tuple[bool, Optional[Tuple[str,str,str]], Optional[str]]:
     if not isinstance(s, str) or not s:
         return False, None, "schema must be a non-empty string"
-    if s.startswith("ldna://"):
-        m = _LDNA_RE.match(s)
-        if not m:
-            return False, None, "invalid LDNA URI; expected ldna://<media>/<name>@<X.Y.Z>"
-        return True, (m.group(1), m.group(2), m.group(3)), None
-    # allow non-LDNA schema identifiers, but nudge toward LDNA
-    return True, None, None
+    m = _LDNA_MATCH(s)
+    if m is None:
+        # allow non-LDNA schema identifiers, but nudge toward LDNA
+        return True, None, None
+    if m.group(1) is None:
+        return False, None, "invalid LDNA URI; expected ldna://<media>/<name>@<X.Y.Z>"
+    return True, m.groups(), None
 
 
 def _is_pos_int(x: Any) -> bool:
@@ -53,7 +60,7 @@ def validate_studspec(obj: Dict[str, Any]) -> List[SpecIssue]:
     memite_id = obj.get("memite_id")
     if not isinstance(memite_id, str) or not memite_id or len(memite_id) < 3:
         issues.append(SpecIssue("/memite_id", "memite_id must be a non-empty string (len>=3)"))
-    elif not _SAFE_ID_RE.match(memite_id) or (".." in memite_id) or ("//" in memite_id):
+    elif not _SAFE_ID_MATCH(memite_id) or (".." in memite_id) or ("//" in memite_id):
         issues.append(SpecIssue("/memite_id", "memite_id contains unsafe characters"))
 
     kind = obj.get("kind")
@@ -78,10 +85,10 @@ def validate_studspec(obj: Dict[str, Any]) -> List[SpecIssue]:
                 if not isinstance(it.get("name"), str) or not it["name"]:
                     issues.append(SpecIssue(f"/io/{port_list_name}/{i}/name", "missing/empty"))
                 sch = it.get("schema")
-                ok, _, emsg = parse_ldna_uri(str(sch) if sch is not None else "")
+                ok, parsed, emsg = parse_ldna_uri(str(sch) if sch is not None else "")
                 if not ok:
                     issues.append(SpecIssue(f"/io/{port_list_name}/{i}/schema", emsg or "invalid schema"))
-                elif isinstance(sch, str) and sch and not sch.startswith("ldna://"):
+                elif parsed is None and isinstance(sch, str) and sch:
                     issues.append(SpecIssue(f"/io/{port_list_name}/{i}/schema", "non-LDNA schema id; prefer ldna:// URIs", severity="warn"))
 
     cons = obj.get("constraints")
@@ -3,15 +3,15 @@ from __future__ import annotations
 import base64
 import json
 import zipfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .policy import MEAPPolicy, canonical_hash_dict
 from .meap_eval import evaluate_bundle_manifest
 from .specs import validate_studspec, validate_tubespec
-from .provenance import canonical_json, hash_bytes
-from .signing import load_public_key
+from .provenance import DEFAULT_DIGEST_ALGO, MANIFEST_DIGESTS, canonical_json, hash_bytes
+from .signing import public_key_from_pem
 from .dsse import verify_dsse
 
 def sha256_bytes(data: bytes) -> str:
@@ -70,15 +70,19 @@ def _read_zip_bytes(z: zipfile.ZipFile, name: str) -> bytes:
     with z.open(name, "r") as f:
         return f.read()
 
+def _load_toolchain_pubkey(allowlist: Dict[str, Any], entry: Dict[str, Any]) -> Tuple[Any, bytes]:
+    """(public key, PEM bytes) for an allowlisted toolchain; the PEM also yields the DSSE keyid."""
+    base_dir = Path(allowlist.get("_base_dir") or ".").resolve()
+    pub_rel = Path(entry["pubkey_path"])
+    pub_path = pub_rel if pub_rel.is_absolute() else (base_dir / pub_rel).resolve()
+    pub_pem = pub_path.read_bytes()
+    return public_key_from_pem(pub_pem), pub_pem
+
 def _calc_bundle_map_hash(files_map: Dict[str, str]) -> str:
     import hashlib
-    h = hashlib.sha256()
-    for name in sorted(files_map.keys()):
-        h.update(name.encode("utf-8"))
-        h.update(b"=")
-        h.update(str(files_map[name]).encode("utf-8"))
-        h.update(b"\n")
-    return h.hexdigest()
+    # Mirrors bundle._calc_bundle_map_hash.
+    blob = "".join(f"{name}={files_map[name]}\n" for name in sorted(files_map)).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
 
 def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, Any]) -> VerifyResult:
     zip_path = Path(zip_path).resolve()
@@ -97,7 +101,8 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
     require_cdx = bool(thr.get("require_cyclonedx_sbom", False))
 
     # normalize allowlist (strip helper keys)
-    allow_for_hash = {k:v for k,v in allowlist.items() if k != "_base_dir"}
+    allow_for_hash = dict(allowlist)
+    allow_for_hash.pop("_base_dir", None)
     allow_hash_expected = canonical_hash_dict(allow_for_hash)
 
     pol_hash_expected = policy.canonical_hash()
@@ -176,11 +181,17 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
                 return VerifyResult(False, f"unexpected_zip_member:{n}", toolchain_id=toolchain_id)
 
         # validate file hashes per manifest
+        digest_algo = str(manifest.get("digest_algo") or DEFAULT_DIGEST_ALGO)
+        new_hash = MANIFEST_DIGESTS.get(digest_algo)
+        if new_hash is None:
+            return VerifyResult(False, f"unsupported_digest_algo:{digest_algo}", toolchain_id=toolchain_id)
         if require_manifest_hashes:
             for fname, expected in files_map.items():
                 if fname not in names:
                     return VerifyResult(False, f"manifest_file_missing:{fname}", toolchain_id=toolchain_id)
-                got = sha256_bytes(_read_zip_bytes(z, fname))
+                h = new_hash()
+                h.update(_read_zip_bytes(z, fname))
+                got = h.hexdigest()
                 if got != expected:
                     return VerifyResult(False, f"hash_mismatch:{fname}", toolchain_id=toolchain_id)
 
@@ -221,16 +232,17 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
         if toolchain_id not in allowed:
             return VerifyResult(False, "toolchain_not_allowed", toolchain_id=toolchain_id, bundle_map_hash=bundle_map_hash)
 
+        # One PEM read/parse serves the legacy signature and both DSSE envelopes.
+        pub = None
+        pub_pem = b""
+
         # verify signature
         if require_sig:
             try:
                 sig = base64.b64decode(_read_zip_bytes(z, "attestation.sig").strip())
             except Exception:
                 return VerifyResult(False, "bad_signature", toolchain_id=toolchain_id, bundle_map_hash=bundle_map_hash)
-            base_dir = Path(allowlist.get("_base_dir") or ".").resolve()
-            pub_rel = Path(allowed[toolchain_id]["pubkey_path"])
-            pub_path = pub_rel if pub_rel.is_absolute() else (base_dir / pub_rel).resolve()
-            pub = load_public_key(pub_path)
+            pub, pub_pem = _load_toolchain_pubkey(allowlist, allowed[toolchain_id])
 
             # attestation v2 signs canonical JSON bytes of attestation.json
             ver = str(att.get("attestation_version") or "1")
@@ -250,11 +262,9 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
 
         # DSSE attestation verification (strict mode)
         if require_dsse or require_cdx:
-            base_dir = Path(allowlist.get("_base_dir") or ".").resolve()
-            pub_rel = Path(allowed[toolchain_id]["pubkey_path"])
-            pub_path = pub_rel if pub_rel.is_absolute() else (base_dir / pub_rel).resolve()
-            pub = load_public_key(pub_path)
-            expected_kid = sha256_bytes(pub_path.read_bytes())
+            if pub is None:
+                pub, pub_pem = _load_toolchain_pubkey(allowlist, allowed[toolchain_id])
+            expected_kid = sha256_bytes(pub_pem)
 
             # verify build attestation dsse binds manifest
             if require_dsse:
@@ -321,7 +331,7 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
                 iss = validate_studspec(stud_obj)
                 if iss:
                     return VerifyResult(False, "invalid_studspec", toolchain_id=toolchain_id,
-                                        bundle_map_hash=bundle_map_hash, studspec_issues=[i.__dict__ for i in iss])
+                                        bundle_map_hash=bundle_map_hash, studspec_issues=[asdict(i) for i in iss])
             except Exception:
                 return VerifyResult(False, "invalid_studspec", toolchain_id=toolchain_id, bundle_map_hash=bundle_map_hash)
 
@@ -331,7 +341,7 @@ def verify_bundle(zip_path: Path, *, policy: MEAPPolicy, allowlist: Dict[str, An
                 iss = validate_tubespec(tube_obj)
                 if iss:
                     return VerifyResult(False, "invalid_tubespec", toolchain_id=toolchain_id,
-                                        bundle_map_hash=bundle_map_hash, tubespec_issues=[i.__dict__ for i in iss])
+                                        bundle_map_hash=bundle_map_hash, tubespec_issues=[asdict(i) for i in iss])
             except Exception:
                 return VerifyResult(False, "invalid_tubespec", toolchain_id=toolchain_id, bundle_map_hash=bundle_map_hash)
 
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from termite.chunking import chunk_text
+
+
+def test_chunk_text_windows_overlap_and_strip():
+    text = "abcdefghij" + " " * 10 + "klmnopqrst"
+    chunks = chunk_text(text, 10, 2, 3)
+    # the [8, 18) window strips down to "ij" and is dropped; indices stay dense
+    assert [(c.index, c.start, c.end, c.text) for c in chunks] == [
+        (0, 0, 10, "abcdefghij"),
+        (1, 16, 26, "klmnop"),
+        (2, 24, 30, "opqrst"),
+    ]
+
+
+def test_chunk_text_rejects_non_advancing_window_only_when_it_must_advance():
+    with pytest.raises(ValueError):
+        chunk_text("x" * 50, 10, 10, 1)
+    # text that fits in one window never needs to advance
+    assert [(c.start, c.end, c.text) for c in chunk_text("x" * 10, 10, 12, 1)] == [(0, 10, "x" * 10)]
+    assert chunk_text("", 10, 10, 1) == []
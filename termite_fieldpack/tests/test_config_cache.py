@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from termite.config import load_config
+
+
+def test_load_config_reuses_unchanged_file_and_reloads_on_edit(tmp_path: Path):
+    p = tmp_path / "termite.yaml"
+    p.write_text("termite:\n  offline_mode: true\n", encoding="utf-8")
+
+    c1 = load_config(p)
+    assert load_config(p) is c1
+    assert c1.offline_mode is True
+
+    p.write_text("termite:\n  offline_mode: false\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    c2 = load_config(p)
+    assert c2 is not c1
+    assert c2.offline_mode is False
+
+
+def test_config_paths_follow_cwd_and_env(tmp_path: Path, monkeypatch):
+    p = tmp_path / "termite.yaml"
+    p.write_text("termite:\n  db_path: ./rt/termite.sqlite\n  cas_root: $FG_TEST_ROOT/cas\n", encoding="utf-8")
+    cfg = load_config(p)
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    monkeypatch.chdir(tmp_path / "a")
+    assert cfg.db_path == (tmp_path / "a" / "rt" / "termite.sqlite").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert cfg.db_path == (tmp_path / "b" / "rt" / "termite.sqlite").resolve()
+
+    monkeypatch.setenv("FG_TEST_ROOT", str(tmp_path / "x"))
+    assert cfg.cas_root == (tmp_path / "x" / "cas").resolve()
+    monkeypatch.setenv("FG_TEST_ROOT", str(tmp_path / "y"))
+    assert cfg.cas_root == (tmp_path / "y" / "cas").resolve()
+
+
+def test_config_paths_follow_retargeted_symlink(tmp_path: Path):
+    (tmp_path / "v1").mkdir()
+    (tmp_path / "v2").mkdir()
+    link = tmp_path / "current"
+    link.symlink_to(tmp_path / "v1", target_is_directory=True)
+    p = tmp_path / "termite.yaml"
+    p.write_text(f"termite:\n  cas_root: {link}/cas\n", encoding="utf-8")
+    cfg = load_config(p)
+
+    assert cfg.cas_root == (tmp_path / "v1" / "cas").resolve()
+    link.unlink()
+    link.symlink_to(tmp_path / "v2", target_is_directory=True)
+    assert cfg.cas_root == (tmp_path / "v2" / "cas").resolve()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import termite.ingest as ingest
+from termite.cas import CAS
+from termite.db import connect, init_db
+
+SCHEMA = Path(__file__).resolve().parents[1] / "sql" / "schema.sql"
+OPTS = dict(max_bytes=1_000_000, extract_text=True, chunk_chars=40, overlap_chars=8, min_chunk_chars=4)
+
+
+def _ingest_and_dump(db: Path, cas_root: Path, run):
+    con = connect(db)
+    try:
+        init_db(con, SCHEMA)
+        cas = CAS(cas_root)
+        cas.init()
+        res = run(con, cas, ingest.Provenance("TEST_TOOLCHAIN"))
+        tables = [
+            [tuple(r) for r in con.execute(f"SELECT * FROM {t} ORDER BY rowid")]
+            for t in ("blobs", "docs", "chunks", "kg_ops")
+        ]
+        return res, tables
+    finally:
+        con.close()
+
+
+def test_ingest_paths_matches_sequential_ingest(tmp_path: Path, monkeypatch):
+    # Timestamps are taken in the writing (parent) process only.
+    monkeypatch.setattr(ingest, "utc_now_iso", lambda: "2024-01-01T00:00:00+00:00")
+    files = []
+    for i in range(4):
+        p = tmp_path / f"f{i}.txt"
+        p.write_text(f"file {i} " + "lorem ipsum dolor sit amet " * (i + 3), encoding="utf-8")
+        files.append(p)
+    (tmp_path / "bin.dat").write_bytes(b"\x00\x01binary")
+    files.append(tmp_path / "bin.dat")
+
+    seq = _ingest_and_dump(
+        tmp_path / "seq.sqlite", tmp_path / "cas",
+        lambda con, cas, prov: [ingest.ingest_path(con, cas, prov, p, **OPTS) for p in files],
+    )
+    par = _ingest_and_dump(
+        tmp_path / "par.sqlite", tmp_path / "cas",
+        lambda con, cas, prov: ingest.ingest_paths(con, cas, prov, files, max_workers=2, **OPTS),
+    )
+    assert [r.doc_id for r in par[0]] == [1, 2, 3, 4, 5]
+    assert par[0][-1].chunks == 0
+    assert par == seq
+
+
+def test_chunk_op_jsons_match_canonical_json():
+    raw_sha, text_sha = "ab" * 32, "cd" * 32
+    doc_node, ch_id = f"doc:{raw_sha}", f"chunk:{raw_sha}:7"
+    node = {"op": "ADD_NODE", "id": ch_id, "type": "Chunk",
+            "attrs": {"doc": doc_node, "index": 7, "start": 120, "end": 160, "text_sha256": text_sha}}
+    edge = {"op": "ADD_EDGE", "src": doc_node, "dst": ch_id, "type": "HAS_CHUNK", "attrs": {}}
+    assert list(ingest._chunk_op_jsons(raw_sha, [(7, 120, 160, "text", text_sha)])) == [
+        ingest.canonical_json(node),
+        ingest.canonical_json(edge),
+    ]
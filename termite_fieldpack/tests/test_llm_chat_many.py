@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+from termite.config import TermiteConfig
+from termite.db import connect, init_db
+from termite.llm_chat import chat, chat_many
+from termite.provenance import verify_chain
+from termite_fieldpack.tests.support.fake_openai_server import _Handler
+
+SCHEMA = Path(__file__).resolve().parents[1] / "sql" / "schema.sql"
+
+
+def test_chat_many_keeps_prompt_order_and_one_audit_chain(tmp_path: Path) -> None:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    try:
+        runtime_root = tmp_path / "runtime"
+        cfg = TermiteConfig({
+            "termite": {
+                "runtime_root": str(runtime_root),
+                "cas_root": str(runtime_root / "cas"),
+                "db_path": str(runtime_root / "termite.sqlite"),
+                "bundles_out": str(tmp_path / "bundles_out"),
+            },
+            "toolchain": {"toolchain_id": "TEST_TOOLCHAIN"},
+            "llm": {"base_url": f"http://127.0.0.1:{httpd.server_port}", "model": "fake-model"},
+        })
+        con = connect(cfg.db_path)
+        init_db(con, SCHEMA)
+        con.close()
+
+        first = chat(cfg, "p0")
+        prompts = [f"p{i}" for i in range(1, 9)]
+        res = chat_many(cfg, prompts)
+        assert [r["content"] for r in res] == [f"fake-ok: {p}" for p in prompts]
+
+        con = connect(cfg.db_path)
+        try:
+            rows = con.execute("SELECT prompt_hash, prev_hash, call_hash FROM llm_calls ORDER BY id").fetchall()
+            assert [r["call_hash"] for r in rows] == [first["call_hash"]] + [r["call_hash"] for r in res]
+            assert [r["prev_hash"] for r in rows[1:]] == [r["call_hash"] for r in rows[:-1]]
+            n_events = con.execute("SELECT COUNT(*) FROM events WHERE event_type = 'LLM_CHAT'").fetchone()[0]
+            assert n_events == 9
+            assert verify_chain(con) is True
+        finally:
+            con.close()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
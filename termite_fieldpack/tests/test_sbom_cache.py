@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from termite.sbom import _installed_distributions
+
+
+def test_installed_distributions_rescans_after_install_into_path_dir(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(sys, "path", [str(tmp_path)])
+    assert _installed_distributions() == []
+
+    dist_info = tmp_path / "fg_sbom_probe-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: fg_sbom_probe\nVersion: 1.0\n", encoding="utf-8")
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert _installed_distributions() == [{"name": "fg_sbom_probe", "version": "1.0"}]
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from termite.specs import parse_ldna_uri, validate_studspec
+
+
+def test_parse_ldna_uri_cases():
+    assert parse_ldna_uri("ldna://text/plain@1.0.0") == (True, ("text", "plain", "1.0.0"), None)
+    assert parse_ldna_uri("schema:plain") == (True, None, None)
+    assert parse_ldna_uri("ldna://text")[0] is False
+    # a trailing newline must not satisfy the end anchor
+    assert parse_ldna_uri("ldna://text/plain@1.0.0\n")[0] is False
+
+
+def test_memite_id_rejects_trailing_newline():
+    issues = validate_studspec({"studspec": "1.0", "memite_id": "abc\n"})
+    assert any(i.path == "/memite_id" for i in issues)